@@ -1,15 +1,81 @@
 # app/api/dependencies/auth.py
-from datetime import datetime, timezone
+import hashlib
+import threading
+import time
 from uuid import UUID
 
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.config import settings
+from app.core.security import get_jwt_verifying_key
 
 security = HTTPBearer(auto_error=False)
 
+# Current-user dicts keyed by a SHA-256 of the token (bearer tokens themselves
+# are not kept around). Tokens are immutable until `exp`, so a short-lived
+# cache skips signature verification and UUID parsing on repeat requests;
+# entries are never served past `exp`. Sync dependencies run in the
+# threadpool, hence the lock. Cached dicts are shared between requests:
+# treat them as read-only.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
+
+class _InvalidPayload(jwt.InvalidTokenError):
+    """Signature is fine but required claims are missing or malformed."""
+
+
+def _user_from_payload(payload: dict) -> dict:
+    user_id = payload.get("sub")
+    workspace_id = payload.get("workspace_id")
+    if not user_id or not workspace_id:
+        raise _InvalidPayload("Missing sub or workspace_id")
+    try:
+        user_id = UUID(str(user_id))
+        workspace_id = UUID(str(workspace_id))
+    except ValueError:
+        raise _InvalidPayload("Malformed sub or workspace_id")
+    return {
+        "id": user_id,
+        "email": payload.get("email") or "",
+        "role": payload.get("role") or "staff",
+        "workspace_id": workspace_id,
+    }
+
+
+def _decode_cached(token: str) -> dict:
+    """Verify a JWT and build the current-user dict, cached until `exp`."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        user, exp = cached
+        if exp > time.time():
+            return user
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    # Cheap structural checks first so junk tokens never reach the crypto.
+    if token.count(".") != 2:
+        raise jwt.DecodeError("Malformed token")
+    if jwt.get_unverified_header(token).get("alg") != settings.jwt_algorithm:
+        raise jwt.InvalidAlgorithmError("Unexpected token algorithm")
+
+    payload = jwt.decode(
+        token,
+        get_jwt_verifying_key(),
+        algorithms=[settings.jwt_algorithm],
+        options={"require": ["exp"]},
+    )
+    user = _user_from_payload(payload)
+    with _token_cache_lock:
+        _token_cache[key] = (user, float(payload["exp"]))
+    return user
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -21,31 +87,17 @@ def get_current_user(
         )
     token = credentials.credentials
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-    except jwt.InvalidTokenError:
+        return _decode_cached(token)
+    except _InvalidPayload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
+            detail="Invalid token payload",
         )
-    user_id = payload.get("sub")
-    email = payload.get("email")
-    role = payload.get("role")
-    workspace_id = payload.get("workspace_id")
-    if not user_id or not workspace_id:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
+            detail="Invalid or expired token",
         )
-    return {
-        "id": str(user_id),
-        "email": email or "",
-        "role": role or "staff",
-        "workspace_id": str(workspace_id),
-    }
 
 def get_current_owner_user(current_user: dict = Depends(get_current_user)):
     if current_user.get("role") != "owner":
@@ -0,0 +1,83 @@
+# app/api/dependencies/workspace.py
+import threading
+from uuid import UUID
+
+from cachetools import TTLCache
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.models.users import StaffRole
+from app.models.workspace import Workspace, WorkspaceStatus
+
+# Workspaces are never hard-deleted, so a positive existence check can be
+# reused for a while. Misses are not cached so freshly onboarded workspaces
+# are visible immediately.
+_workspace_exists_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_workspace_exists_lock = threading.Lock()
+
+_WORKSPACE_EXISTS_STMT = select(Workspace.id).where(Workspace.id == bindparam("workspace_id"))
+
+
+def ensure_workspace_exists(db: Session, workspace_id: UUID) -> None:
+    """Raise 404 unless the workspace row exists (cached ``SELECT id``)."""
+    with _workspace_exists_lock:
+        if workspace_id in _workspace_exists_cache:
+            return
+    if db.scalar(_WORKSPACE_EXISTS_STMT, {"workspace_id": workspace_id}) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+    with _workspace_exists_lock:
+        _workspace_exists_cache[workspace_id] = True
+
+
+def get_workspace_or_403(db: Session, workspace_id: UUID, current_user: dict) -> None:
+    """Shared guard for workspace-scoped routers: JWT workspace must match and exist."""
+    if current_user["workspace_id"] != workspace_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your workspace")
+    ensure_workspace_exists(db, workspace_id)
+
+
+# Per-caller workspace membership: (workspace_id, email) -> StaffRole. Staff
+# mutations call `invalidate_workspace_access` so role changes and removals
+# take effect immediately on this process; the TTL bounds staleness elsewhere.
+_workspace_access_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_workspace_access_lock = threading.Lock()
+
+
+def get_cached_workspace_role(workspace_id: str, email: str) -> StaffRole | None:
+    with _workspace_access_lock:
+        return _workspace_access_cache.get((str(workspace_id), email))
+
+
+def cache_workspace_role(workspace_id: str, email: str, role: StaffRole) -> None:
+    with _workspace_access_lock:
+        _workspace_access_cache[(str(workspace_id), email)] = role
+
+
+def invalidate_workspace_access(workspace_id: str) -> None:
+    """Forget cached memberships for a workspace after staff changes."""
+    workspace_id = str(workspace_id)
+    with _workspace_access_lock:
+        for key in [k for k in _workspace_access_cache.keys() if k[0] == workspace_id]:
+            _workspace_access_cache.pop(key, None)
+
+
+# Public endpoints only need "is this workspace active?"; positive hits only.
+_active_workspace_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_active_workspace_lock = threading.Lock()
+
+_ACTIVE_WORKSPACE_STMT = select(Workspace.id).where(
+    Workspace.id == bindparam("workspace_id"),
+    Workspace.status == WorkspaceStatus.active,
+)
+
+
+def ensure_workspace_active(db: Session, workspace_id: UUID) -> None:
+    """Raise 404 unless the workspace exists and is active (cached)."""
+    with _active_workspace_lock:
+        if workspace_id in _active_workspace_cache:
+            return
+    if db.scalar(_ACTIVE_WORKSPACE_STMT, {"workspace_id": workspace_id}) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found or not active")
+    with _active_workspace_lock:
+        _active_workspace_cache[workspace_id] = True
@@ -1,16 +1,18 @@
 # app/api/routers/auth.py
-from datetime import datetime, timedelta, timezone
+import time
 
 import jwt
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi import status
 from pydantic import BaseModel
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.api.dependencies.db import get_db
 from app.core.config import settings
-from app.core.security import verify_password
+from app.core.security import get_jwt_signing_key, hash_password, needs_rehash, verify_password
 from app.models.users import StaffUser
+from app.services.auth_service import get_staff_login, invalidate_staff_login
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -31,7 +33,7 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
     Authenticate staff/owner by email and password. Returns a JWT.
     Frontend should set it as auth_token cookie (or use in Authorization header).
     """
-    user = db.query(StaffUser).filter(StaffUser.email == payload.email).first()
+    user = get_staff_login(db, payload.email)
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,21 +44,33 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
-    expires = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expires_minutes)
+    # Sync handler, so the KDF above already runs in the threadpool rather
+    # than on the event loop. Upgrade legacy/weaker hashes while we have the
+    # plaintext.
+    if needs_rehash(user.hashed_password):
+        db.execute(
+            update(StaffUser)
+            .where(StaffUser.id == user.id)
+            .values(hashed_password=hash_password(payload.password))
+        )
+        db.commit()
+        invalidate_staff_login(user.email)
+    now = int(time.time())
+    expires_in = settings.access_token_expires_minutes * 60
     payload_jwt = {
         "sub": str(user.id),
         "email": user.email,
         "role": user.role.value,
         "workspace_id": str(user.workspace_id),
-        "exp": expires,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + expires_in,
+        "iat": now,
     }
     token = jwt.encode(
         payload_jwt,
-        settings.jwt_secret_key,
+        get_jwt_signing_key(),
         algorithm=settings.jwt_algorithm,
     )
     return LoginResponse(
         token=token,
-        expires_in=settings.access_token_expires_minutes * 60,
+        expires_in=expires_in,
     )
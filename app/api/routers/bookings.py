@@ -1,28 +1,35 @@
 # app/api/routers/bookings.py – owner/staff booking actions (auth required)
 from uuid import UUID
 import httpx
+import orjson
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from loguru import logger
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import bindparam, update
 from pydantic import BaseModel
 
 from app.api.dependencies.auth import get_current_user
 from app.api.dependencies.db import get_db
+from app.api.dependencies.workspace import get_workspace_or_403
 from app.core.config import settings
-from app.models.workspace import Workspace
+from app.core.public_cache import invalidate_public_cache
 from app.models.booking import Booking, BookingStatus
 
 router = APIRouter()
 
+# Shared Resend client, opened/closed by the app lifecycle hooks in main.py.
+_resend_client: httpx.AsyncClient | None = None
 
-def _get_workspace_or_403(db: Session, workspace_id: UUID, current_user: dict) -> Workspace:
-    if str(current_user["workspace_id"]) != str(workspace_id):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your workspace")
-    ws = db.get(Workspace, workspace_id)
-    if not ws:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-    return ws
+_UPDATE_BOOKING_STATUS_STMT = (
+    update(Booking)
+    .where(
+        Booking.id == bindparam("booking_id"),
+        Booking.workspace_id == bindparam("workspace_id"),
+    )
+    .values(status=bindparam("new_status"))
+    .returning(Booking.id, Booking.status)
+)
 
 
 class BookingStatusUpdate(BaseModel):
@@ -38,7 +45,7 @@ def update_booking_status(
     current_user: dict = Depends(get_current_user),
 ):
     """Owner or staff: set booking status (e.g. confirm an upcoming booking or mark completed/no_show)."""
-    _get_workspace_or_403(db, workspace_id, current_user)
+    get_workspace_or_403(db, workspace_id, current_user)
     try:
         new_status = BookingStatus(payload.status)
     except ValueError:
@@ -46,17 +53,17 @@ def update_booking_status(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid status; use confirmed, completed, no_show, or cancelled",
         )
-    booking = db.scalar(
-        select(Booking).where(
-            Booking.id == booking_id,
-            Booking.workspace_id == workspace_id,
-        )
-    )
-    if not booking:
+    row = db.execute(
+        _UPDATE_BOOKING_STATUS_STMT,
+        {"booking_id": booking_id, "workspace_id": workspace_id, "new_status": new_status},
+        execution_options={"synchronize_session": False},
+    ).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-    booking.status = new_status
     db.commit()
-    return {"id": str(booking.id), "status": booking.status.value}
+    # Cancelling frees the slot on the public booking page
+    invalidate_public_cache(workspace_id)
+    return {"id": str(row.id), "status": row.status.value}
 
 
 class EmailConfirmationRequest(BaseModel):
@@ -66,44 +73,64 @@ class EmailConfirmationRequest(BaseModel):
     start_at: str
 
 
-@router.post("/send-confirmation")
+async def start_resend_client() -> None:
+    """Open the shared Resend client (FastAPI startup hook)."""
+    global _resend_client
+    if _resend_client is None:
+        # Auth/content-type headers are normalized once here and merged into
+        # every request instead of being rebuilt per send.
+        headers = httpx.Headers({"Content-Type": "application/json"})
+        if settings.resend_api_key:
+            headers["Authorization"] = f"Bearer {settings.resend_api_key}"
+        _resend_client = httpx.AsyncClient(
+            base_url="https://api.resend.com",
+            headers=headers,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+
+
+async def close_resend_client() -> None:
+    """Close the shared Resend client (FastAPI shutdown hook)."""
+    global _resend_client
+    if _resend_client is not None:
+        await _resend_client.aclose()
+        _resend_client = None
+
+
+async def _send_confirmation_email(email_data: dict) -> None:
+    if _resend_client is None:
+        await start_resend_client()
+    try:
+        response = await _resend_client.post("/emails", content=orjson.dumps(email_data))
+    except httpx.HTTPError as exc:
+        logger.error(f"Booking confirmation email failed: {exc}")
+        return
+    if response.status_code != 200:
+        logger.error(f"Booking confirmation email failed: {response.status_code} {response.text}")
+
+
+@router.post("/send-confirmation", status_code=status.HTTP_202_ACCEPTED)
 async def send_booking_confirmation(
     request: EmailConfirmationRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
-    """Send booking confirmation email using Resend API"""
+    """Queue a booking confirmation email via the Resend API."""
     if not settings.resend_api_key:
         raise HTTPException(status_code=500, detail="Email service not configured")
-    
-    try:
-        start_time = request.start_at.replace('Z', '+00:00')  # Ensure proper datetime format
-        text = f"Hello {request.contact_name},\n\nYour booking (ID: {request.booking_id}) is confirmed for {start_time}.\n\nThank you!"
-        
-        email_data = {
-            "from": "onboarding@resend.dev",
-            "to": [request.email],
-            "subject": "Booking Confirmation",
-            "text": text
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.resend.com/emails",
-                headers={
-                    "Authorization": f"Bearer {settings.resend_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json=email_data
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=500, 
-                    detail=f"Failed to send email: {response.text}"
-                )
-                
-        return {"message": "Confirmation sent successfully"}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Email sending failed: {str(e)}")
+
+    start_time = request.start_at.replace('Z', '+00:00')  # Ensure proper datetime format
+    text = f"Hello {request.contact_name},\n\nYour booking (ID: {request.booking_id}) is confirmed for {start_time}.\n\nThank you!"
+
+    email_data = {
+        "from": "onboarding@resend.dev",
+        "to": [request.email],
+        "subject": "Booking Confirmation",
+        "text": text
+    }
+    # Keep-alive connections on the shared client are reused across sends;
+    # the request returns as soon as the send is enqueued, so failures are
+    # only logged and the response promises no delivery.
+    background_tasks.add_task(_send_confirmation_email, email_data)
+    return {"message": "Confirmation queued"}
@@ -2,13 +2,14 @@
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, bindparam, insert, tuple_, update
 
 from app.api.dependencies.auth import get_current_user
 from app.api.dependencies.db import get_db
-from app.models.workspace import Workspace
+from app.api.dependencies.workspace import get_workspace_or_403
+from app.core.public_cache import invalidate_public_cache
 from app.models.form_template import FormTemplate
 from app.models.form_submission import FormSubmission
 from app.models.booking_type import BookingType
@@ -20,18 +21,50 @@ from app.schemas.form import (
     FormTemplateOut,
     FormSubmissionOut,
 )
+from app.schemas.utils import decode_cursor, encode_cursor, orm_to_out
 from pydantic import BaseModel
 
 router = APIRouter()
 
+# Answer keys that read as the customer's own message, in priority order
+_INBOX_MESSAGE_FIELDS = ("message", "notes", "special_requests", "comments", "additional_info")
 
-def _get_workspace_or_403(db: Session, workspace_id: UUID, current_user: dict) -> Workspace:
-    if str(current_user["workspace_id"]) != str(workspace_id):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your workspace")
-    ws = db.get(Workspace, workspace_id)
-    if not ws:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-    return ws
+_LIST_FORM_TEMPLATES_STMT = select(FormTemplate).where(
+    FormTemplate.workspace_id == bindparam("workspace_id"),
+    FormTemplate.is_deleted.is_(False),
+).order_by(FormTemplate.name)
+
+# Flat column projection: skips ORM hydration and the identity map, and the
+# labels line up with PendingFormBookingOut's field names.
+_PENDING_FORM_BOOKINGS_STMT = (
+    select(
+        Booking.id.label("booking_id"),
+        Contact.id.label("contact_id"),
+        Contact.full_name.label("contact_name"),
+        Contact.primary_email.label("contact_email"),
+        Contact.primary_phone.label("contact_phone"),
+        FormTemplate.id.label("form_template_id"),
+        FormTemplate.name.label("form_name"),
+        Booking.start_at.label("booking_start_at"),
+    )
+    .join(Contact, Booking.contact_id == Contact.id)
+    .join(FormTemplate, and_(
+        FormTemplate.workspace_id == bindparam("workspace_id"),
+        FormTemplate.booking_type_id == Booking.booking_type_id,
+        FormTemplate.is_deleted.is_(False),
+        FormTemplate.active.is_(True),
+    ))
+    .where(
+        Booking.workspace_id == bindparam("workspace_id"),
+        Booking.status == BookingStatus.completed,
+        Booking.id.not_in(
+            select(FormSubmission.booking_id).where(
+                FormSubmission.workspace_id == bindparam("workspace_id")
+            )
+        ),
+    )
+    .order_by(Booking.start_at.desc())
+)
 
 
 @router.get(
@@ -43,14 +76,27 @@ def list_form_templates(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    _get_workspace_or_403(db, workspace_id, current_user)
+    get_workspace_or_403(db, workspace_id, current_user)
     templates = db.scalars(
-        select(FormTemplate).where(
-            FormTemplate.workspace_id == workspace_id,
-            FormTemplate.is_deleted.is_(False),
-        ).order_by(FormTemplate.name)
+        _LIST_FORM_TEMPLATES_STMT, {"workspace_id": workspace_id}
     ).all()
-    return [FormTemplateOut.model_validate(t) for t in templates]
+    return [orm_to_out(FormTemplateOut, t) for t in templates]
+
+
+def _pick_inbox_field_id(schema: dict | None) -> str | None:
+    """
+    Choose the field whose answer is posted to the inbox on submission:
+    a known message-style field first, otherwise the first text/textarea field.
+    """
+    fields = [f for f in ((schema or {}).get("fields") or []) if isinstance(f, dict)]
+    field_ids = {f.get("id") for f in fields}
+    for name in _INBOX_MESSAGE_FIELDS:
+        if name in field_ids:
+            return name
+    for field in fields:
+        if field.get("type", "") in ("text", "textarea") and field.get("id"):
+            return field["id"]
+    return None
 
 
 @router.post(
@@ -64,23 +110,30 @@ def create_form_template(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    ws = _get_workspace_or_403(db, workspace_id, current_user)
+    get_workspace_or_403(db, workspace_id, current_user)
     if payload.booking_type_id:
         bt = db.get(BookingType, payload.booking_type_id)
         if not bt or bt.workspace_id != workspace_id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid booking_type_id")
-    template = FormTemplate(
-        workspace_id=ws.id,
-        name=payload.name,
-        description=payload.description,
-        schema=payload.schema_,
-        active=payload.active,
-        booking_type_id=payload.booking_type_id,
+    # INSERT ... RETURNING hands back server defaults (timestamps) in the same
+    # round trip; build the response before commit expires the instance.
+    template = db.scalar(
+        insert(FormTemplate)
+        .values(
+            workspace_id=workspace_id,
+            name=payload.name,
+            description=payload.description,
+            schema=payload.schema_,
+            inbox_field_id=_pick_inbox_field_id(payload.schema_),
+            active=payload.active,
+            booking_type_id=payload.booking_type_id,
+        )
+        .returning(FormTemplate)
     )
-    db.add(template)
+    out = orm_to_out(FormTemplateOut, template)
     db.commit()
-    db.refresh(template)
-    return FormTemplateOut.model_validate(template)
+    invalidate_public_cache(workspace_id)
+    return out
 
 
 @router.get(
@@ -89,18 +142,36 @@ def create_form_template(
 )
 def list_form_submissions(
     workspace_id: UUID,
+    response: Response,
     template_id: UUID | None = None,
+    before: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    _get_workspace_or_403(db, workspace_id, current_user)
+    """
+    Newest first. Unpaged unless `limit` is given; then pass the `X-Next-Cursor`
+    response header back as `before` for the next page.
+    """
+    get_workspace_or_403(db, workspace_id, current_user)
     q = select(FormSubmission).where(
         FormSubmission.workspace_id == workspace_id,
-    ).order_by(FormSubmission.submitted_at.desc())
+    ).order_by(FormSubmission.submitted_at.desc(), FormSubmission.id.desc())
     if template_id:
         q = q.where(FormSubmission.form_template_id == template_id)
+    if before:
+        try:
+            before_at, before_id = decode_cursor(before)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        q = q.where(tuple_(FormSubmission.submitted_at, FormSubmission.id) < (before_at, before_id))
+    if limit is not None:
+        q = q.limit(limit)
     submissions = db.scalars(q).all()
-    return [FormSubmissionOut.model_validate(s) for s in submissions]
+    if limit is not None and len(submissions) == limit:
+        last = submissions[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.submitted_at, last.id)
+    return [orm_to_out(FormSubmissionOut, s) for s in submissions]
 
 
 class PendingFormBookingOut(BaseModel):
@@ -127,42 +198,11 @@ def list_pending_form_bookings(
     current_user: dict = Depends(get_current_user),
 ):
     """Completed bookings that have a form linked to their booking type but no form submission yet."""
-    _get_workspace_or_403(db, workspace_id, current_user)
-    subq = (
-        select(FormSubmission.booking_id).where(
-            FormSubmission.workspace_id == workspace_id
-        )
-    )
-    stmt = (
-        select(Booking, Contact, FormTemplate)
-        .join(Contact, Booking.contact_id == Contact.id)
-        .join(FormTemplate, and_(
-            FormTemplate.workspace_id == workspace_id,
-            FormTemplate.booking_type_id == Booking.booking_type_id,
-            FormTemplate.is_deleted.is_(False),
-            FormTemplate.active.is_(True),
-        ))
-        .where(
-            Booking.workspace_id == workspace_id,
-            Booking.status == BookingStatus.completed,
-            Booking.id.not_in(subq),
-        )
-        .order_by(Booking.start_at.desc())
-    )
-    rows = db.execute(stmt).all()
-    return [
-        PendingFormBookingOut(
-            booking_id=b.id,
-            contact_id=c.id,
-            contact_name=c.full_name,
-            contact_email=c.primary_email,
-            contact_phone=c.primary_phone,
-            form_template_id=ft.id,
-            form_name=ft.name,
-            booking_start_at=b.start_at,
-        )
-        for b, c, ft in rows
-    ]
+    get_workspace_or_403(db, workspace_id, current_user)
+    rows = db.execute(
+        _PENDING_FORM_BOOKINGS_STMT, {"workspace_id": workspace_id}
+    ).mappings()
+    return [PendingFormBookingOut.model_construct(**row) for row in rows]
 
 
 @router.get(
@@ -175,7 +215,7 @@ def get_form_template(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    _get_workspace_or_403(db, workspace_id, current_user)
+    get_workspace_or_403(db, workspace_id, current_user)
     template = db.scalar(
         select(FormTemplate).where(
             FormTemplate.id == template_id,
@@ -199,33 +239,42 @@ def update_form_template(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    ws = _get_workspace_or_403(db, workspace_id, current_user)
-    template = db.scalar(
-        select(FormTemplate).where(
-            FormTemplate.id == template_id,
-            FormTemplate.workspace_id == workspace_id,
-            FormTemplate.is_deleted.is_(False),
-        )
-    )
-    if not template:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form template not found")
+    get_workspace_or_403(db, workspace_id, current_user)
+    changes: dict = {}
     if payload.name is not None:
-        template.name = payload.name
+        changes["name"] = payload.name
     if payload.description is not None:
-        template.description = payload.description
+        changes["description"] = payload.description
     if payload.schema_ is not None:
-        template.schema = payload.schema_
+        changes["schema"] = payload.schema_
+        changes["inbox_field_id"] = _pick_inbox_field_id(payload.schema_)
     if payload.active is not None:
-        template.active = payload.active
+        changes["active"] = payload.active
     if payload.booking_type_id is not None:
         if payload.booking_type_id:
             bt = db.get(BookingType, payload.booking_type_id)
             if not bt or bt.workspace_id != workspace_id:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid booking_type_id")
-        template.booking_type_id = payload.booking_type_id
+        changes["booking_type_id"] = payload.booking_type_id
+    where = (
+        FormTemplate.id == template_id,
+        FormTemplate.workspace_id == workspace_id,
+        FormTemplate.is_deleted.is_(False),
+    )
+    if changes:
+        # UPDATE ... RETURNING: the fresh row comes back without a refresh SELECT.
+        template = db.scalar(
+            update(FormTemplate).where(*where).values(**changes).returning(FormTemplate),
+            execution_options={"synchronize_session": False},
+        )
+    else:
+        template = db.scalar(select(FormTemplate).where(*where))
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form template not found")
+    out = orm_to_out(FormTemplateOut, template)
     db.commit()
-    db.refresh(template)
-    return FormTemplateOut.model_validate(template)
+    invalidate_public_cache(workspace_id)
+    return out
 
 
 @router.delete(
@@ -238,7 +287,7 @@ def delete_form_template(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    _get_workspace_or_403(db, workspace_id, current_user)
+    get_workspace_or_403(db, workspace_id, current_user)
     template = db.scalar(
         select(FormTemplate).where(
             FormTemplate.id == template_id,
@@ -250,4 +299,5 @@ def delete_form_template(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form template not found")
     template.is_deleted = True
     db.commit()
+    invalidate_public_cache(workspace_id)
     return None
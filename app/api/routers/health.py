@@ -1,15 +1,52 @@
 # app/api/routers/health.py
-from fastapi import APIRouter, Depends
+import threading
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.api.dependencies.db import get_db
+from app.core.database import SessionLocal
 
 router = APIRouter(tags=["health"])
 
+# Liveness probes hit /health every few seconds per pod; only touch the DB
+# once per interval and reuse the last result in between. Only the caller that
+# wins the lock runs the check; the rest answer with the last result instead
+# of queueing (each holding a worker thread) behind a slow pool checkout.
+_CHECK_INTERVAL_SECONDS = 5.0
+_last_check: float = float("-inf")
+_last_ok: bool = False
+_check_lock = threading.Lock()
+
+
+def _db_ok(db: Session) -> bool:
+    try:
+        db.execute(text("SELECT 1"))
+        return True
+    except Exception:  # noqa: BLE001
+        return False
+
 
 @router.get("/health")
-def health(db: Session = Depends(get_db)):
-    # Lightweight DB check
-    db.execute(text("SELECT 1"))
-    return {"status": "ok"}
\ No newline at end of file
+def health():
+    global _last_check, _last_ok
+    if time.monotonic() - _last_check >= _CHECK_INTERVAL_SECONDS and _check_lock.acquire(blocking=False):
+        try:
+            with SessionLocal() as db:
+                _last_ok = _db_ok(db)
+            _last_check = time.monotonic()
+        finally:
+            _check_lock.release()
+    if not _last_ok:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database unavailable")
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def ready(db: Session = Depends(get_db)):
+    # Readiness always checks the DB
+    if not _db_ok(db):
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Database unavailable")
+    return {"status": "ok"}
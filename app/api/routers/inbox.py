@@ -2,14 +2,15 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, tuple_
 from pydantic import BaseModel
 
 from app.api.dependencies.db import get_db
 from app.api.dependencies.auth import get_current_user
 from app.schemas.message import StaffSendMessageRequest, MessageOut
+from app.schemas.utils import decode_cursor, encode_cursor, orm_to_out
 from app.services.inbox_service import InboxService
 from app.models.conversation import Conversation
 from app.models.contact import Contact
@@ -17,6 +18,40 @@ from app.models.message import Message, MessageDirection
 
 router = APIRouter(prefix="/inbox", tags=["inbox"])
 
+_LIST_CONVERSATIONS_STMT = (
+    select(
+        Conversation.id,
+        Contact.full_name.label("contact_name"),
+        Contact.id.label("contact_id"),
+        Conversation.last_message_at,
+    )
+    .join(Contact, Conversation.contact_id == Contact.id)
+    .where(
+        Conversation.workspace_id == bindparam("workspace_id"),
+        Conversation.is_deleted.is_(False),
+    )
+    .order_by(Conversation.last_message_at.desc().nullslast(), Conversation.updated_at.desc())
+)
+
+# Served by ix_messages_ws_conv_created (workspace_id, conversation_id, created_at).
+# Newest first so the default page is the latest one; id breaks timestamp ties.
+_LIST_MESSAGES_STMT = (
+    select(Message)
+    .where(
+        Message.conversation_id == bindparam("conversation_id"),
+        Message.workspace_id == bindparam("workspace_id"),
+    )
+    .order_by(Message.created_at.desc(), Message.id.desc())
+    .limit(bindparam("limit"))
+)
+_LIST_MESSAGES_BEFORE_STMT = _LIST_MESSAGES_STMT.where(
+    tuple_(Message.created_at, Message.id)
+    < tuple_(
+        bindparam("before_at", type_=Message.created_at.type),
+        bindparam("before_id", type_=Message.id.type),
+    )
+)
+
 
 class ConversationListItem(BaseModel):
     id: UUID
@@ -47,7 +82,7 @@ def _workspace_from_user(current_user: dict) -> UUID:
     wid = current_user.get("workspace_id")
     if not wid:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="No workspace")
-    return UUID(wid) if isinstance(wid, str) else wid
+    return wid
 
 
 @router.get("/conversations", response_model=list[ConversationListItem])
@@ -56,53 +91,44 @@ def list_conversations(
     current_user: dict = Depends(get_current_user),
 ):
     workspace_id = _workspace_from_user(current_user)
-    convs = db.execute(
-        select(Conversation, Contact)
-        .join(Contact, Conversation.contact_id == Contact.id)
-        .where(
-            Conversation.workspace_id == workspace_id,
-            Conversation.is_deleted.is_(False),
-        )
-        .order_by(Conversation.last_message_at.desc().nullslast(), Conversation.updated_at.desc())
-    ).all()
-    return [
-        ConversationListItem(
-            id=c.id,
-            contact_name=contact.full_name,
-            contact_id=contact.id,
-            last_message_at=c.last_message_at,
-        )
-        for c, contact in convs
-    ]
+    rows = db.execute(
+        _LIST_CONVERSATIONS_STMT, {"workspace_id": workspace_id}
+    ).mappings()
+    return [ConversationListItem.model_construct(**row) for row in rows]
 
 
 @router.get("/conversations/{conversation_id}/messages", response_model=list[MessageListItem])
 def list_conversation_messages(
     conversation_id: UUID,
+    response: Response,
+    before: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
+    """
+    The latest `limit` messages, oldest-first. Pass the `X-Next-Cursor` response
+    header back as `before` to fetch the page of older messages; it is absent
+    once the start of the thread is reached.
+    """
     workspace_id = _workspace_from_user(current_user)
     conv = db.get(Conversation, conversation_id)
     if not conv or conv.workspace_id != workspace_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
-    messages = list(
-        db.scalars(
-            select(Message)
-            .where(
-                Message.conversation_id == conversation_id,
-                Message.workspace_id == workspace_id,
-            )
-            .order_by(Message.created_at.asc())
-        ).all()
-    )
-    return [MessageListItem(
-        id=m.id,
-        direction=m.direction,
-        body_text=m.body_text,
-        subject=m.subject,
-        created_at=m.created_at,
-    ) for m in messages]
+    params = {"conversation_id": conversation_id, "workspace_id": workspace_id, "limit": limit}
+    if before is None:
+        stmt = _LIST_MESSAGES_STMT
+    else:
+        try:
+            params["before_at"], params["before_id"] = decode_cursor(before)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        stmt = _LIST_MESSAGES_BEFORE_STMT
+    messages = db.scalars(stmt, params).all()
+    if len(messages) == limit:
+        oldest = messages[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(oldest.created_at, oldest.id)
+    return [orm_to_out(MessageListItem, m) for m in reversed(messages)]
 
 
 @router.post(
@@ -1,10 +1,15 @@
 # app/api/routers/inventory.py
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import and_, bindparam, exists, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.api.dependencies.db import get_db
 from app.api.dependencies.auth import get_current_user
+from app.api.dependencies.workspace import cache_workspace_role, get_cached_workspace_role
 from app.models.inventory_item import InventoryItem
 from app.models.users import StaffUser, StaffRole
 from app.models.workspace import Workspace
@@ -12,29 +17,72 @@ from app.schemas.inventory import InventoryCreate, InventoryOut, InventoryUpdate
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
-def _get_workspace_or_403(db: Session, workspace_id: str, current_user: dict, require_owner: bool = False) -> Workspace:
-    """Get workspace and verify user access."""
-    workspace = db.query(Workspace).filter(
+# Columns in InventoryOut order; list_inventory serializes these rows directly.
+_LIST_INVENTORY_STMT = (
+    select(
+        InventoryItem.id,
+        InventoryItem.sku,
+        InventoryItem.name,
+        InventoryItem.description,
+        InventoryItem.current_quantity,
+        InventoryItem.reorder_threshold,
+        InventoryItem.unit,
+        InventoryItem.created_at,
+        InventoryItem.updated_at,
+    )
+    .where(
+        InventoryItem.workspace_id == bindparam("workspace_id"),
+        InventoryItem.is_deleted.is_(False),
+    )
+    .order_by(InventoryItem.name)
+)
+_LIST_INVENTORY_BATCH = 500
+
+_ADJUST_QUANTITY_STMT = (
+    update(InventoryItem)
+    .where(
+        InventoryItem.id == bindparam("item_id"),
+        InventoryItem.workspace_id == bindparam("workspace_id"),
+        InventoryItem.is_deleted.is_(False),
+        InventoryItem.current_quantity + bindparam("delta") >= 0,
+    )
+    .values(current_quantity=InventoryItem.current_quantity + bindparam("delta"))
+    .returning(InventoryItem.current_quantity)
+)
+
+def _get_workspace_or_403(db: Session, workspace_id: str, current_user: dict, require_owner: bool = False) -> None:
+    """Verify the caller has access to the workspace."""
+    email = current_user.get("email")
+    role = get_cached_workspace_role(workspace_id, email)
+    if role is None:
+        role = _load_workspace_role(db, workspace_id, email)
+        cache_workspace_role(workspace_id, email, role)
+    
+    # Check if owner role is required
+    if require_owner and role != StaffRole.owner:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can perform this action")
+
+
+def _load_workspace_role(db: Session, workspace_id: str, email: str) -> StaffRole:
+    # One round trip: the outer join still returns the workspace when the
+    # caller has no staff row, so 404 vs 403 stays distinguishable.
+    row = db.query(Workspace, StaffUser).outerjoin(
+        StaffUser,
+        and_(
+            StaffUser.workspace_id == Workspace.id,
+            StaffUser.email == email,
+            StaffUser.is_deleted.is_(False),
+        ),
+    ).filter(
         Workspace.id == workspace_id
     ).first()
-    if not workspace:
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-    
-    # Check if user has access to this workspace
-    staff_user = db.query(StaffUser).filter(
-        StaffUser.workspace_id == workspace_id,
-        StaffUser.email == current_user.get("email"),
-        StaffUser.is_deleted.is_(False)
-    ).first()
+    workspace, staff_user = row
     
     if not staff_user:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    
-    # Check if owner role is required
-    if require_owner and staff_user.role != StaffRole.owner:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can perform this action")
-    
-    return workspace
+    return staff_user.role
 
 @router.get("/{workspace_id}", response_model=List[InventoryOut])
 def list_inventory(
@@ -43,27 +91,22 @@ def list_inventory(
     current_user: dict = Depends(get_current_user),
 ):
     """List all inventory items for the workspace."""
-    workspace = _get_workspace_or_403(db, workspace_id, current_user)
-    
-    items = db.query(InventoryItem).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted.is_(False)
-    ).order_by(InventoryItem.name).all()
-    
-    return [
-        InventoryOut(
-            id=str(item.id),
-            sku=item.sku,
-            name=item.name,
-            description=item.description,
-            current_quantity=item.current_quantity,
-            reorder_threshold=item.reorder_threshold,
-            unit=item.unit,
-            created_at=item.created_at,
-            updated_at=item.updated_at,
-        )
-        for item in items
+    _get_workspace_or_403(db, workspace_id, current_user)
+    
+    # Server-side cursor in batches, each batch dumped straight to JSON by
+    # orjson: no ORM objects, no pydantic models. The body is assembled here
+    # rather than streamed because the session closes before the response
+    # is sent.
+    result = db.execute(
+        _LIST_INVENTORY_STMT,
+        {"workspace_id": workspace_id},
+        execution_options={"yield_per": _LIST_INVENTORY_BATCH},
+    )
+    chunks = [
+        orjson.dumps([row._asdict() for row in batch])[1:-1]
+        for batch in result.partitions()
     ]
+    return Response(content=b"[" + b",".join(chunks) + b"]", media_type="application/json")
 
 @router.post("/{workspace_id}", response_model=InventoryOut)
 def create_inventory_item(
@@ -73,42 +116,33 @@ def create_inventory_item(
     current_user: dict = Depends(get_current_user),
 ):
     """Create a new inventory item (owner only)."""
-    workspace = _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
-    
-    # Check if SKU already exists
-    existing = db.query(InventoryItem).filter(
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.sku == payload.sku,
-        InventoryItem.is_deleted.is_(False)
-    ).first()
-    if existing:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Item with this SKU already exists")
-    
-    inventory_item = InventoryItem(
-        workspace_id=workspace_id,
-        sku=payload.sku,
-        name=payload.name,
-        description=payload.description,
-        current_quantity=payload.current_quantity,
-        reorder_threshold=payload.reorder_threshold,
-        unit=payload.unit,
+    _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
+    
+    # INSERT ... ON CONFLICT against the partial unique index: one round trip,
+    # and concurrent creates with the same SKU can't both succeed.
+    inventory_item = db.scalar(
+        insert(InventoryItem)
+        .values(
+            workspace_id=workspace_id,
+            sku=payload.sku,
+            name=payload.name,
+            description=payload.description,
+            current_quantity=payload.current_quantity,
+            reorder_threshold=payload.reorder_threshold,
+            unit=payload.unit,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[InventoryItem.workspace_id, InventoryItem.sku],
+            index_where=text("is_deleted = false"),
+        )
+        .returning(InventoryItem)
     )
-    
-    db.add(inventory_item)
+    if inventory_item is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Item with this SKU already exists")
+    out = InventoryOut.model_validate(inventory_item)
     db.commit()
-    db.refresh(inventory_item)
     
-    return InventoryOut(
-        id=str(inventory_item.id),
-        sku=inventory_item.sku,
-        name=inventory_item.name,
-        description=inventory_item.description,
-        current_quantity=inventory_item.current_quantity,
-        reorder_threshold=inventory_item.reorder_threshold,
-        unit=inventory_item.unit,
-        created_at=inventory_item.created_at,
-        updated_at=inventory_item.updated_at,
-    )
+    return out
 
 @router.put("/{workspace_id}/{item_id}", response_model=InventoryOut)
 def update_inventory_item(
@@ -119,55 +153,35 @@ def update_inventory_item(
     current_user: dict = Depends(get_current_user),
 ):
     """Update an inventory item (owner only)."""
-    workspace = _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
+    _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
     
-    item = db.query(InventoryItem).filter(
+    # Only fields the client actually sent; None still means "leave as is".
+    data = {k: v for k, v in payload.model_dump(exclude_unset=True).items() if v is not None}
+    live_item = (
         InventoryItem.id == item_id,
         InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted.is_(False)
-    ).first()
+        InventoryItem.is_deleted.is_(False),
+    )
+    if data:
+        # One UPDATE ... RETURNING; SKU clashes are caught by inventory_ws_sku_uq.
+        try:
+            item = db.scalar(
+                update(InventoryItem).where(*live_item).values(**data).returning(InventoryItem),
+                execution_options={"synchronize_session": False},
+            )
+        except IntegrityError as exc:
+            db.rollback()
+            if "inventory_ws_sku_uq" in str(exc.orig):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Item with this SKU already exists")
+            raise
+    else:
+        item = db.scalar(select(InventoryItem).where(*live_item))
     if not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found")
     
-    # Check if new SKU conflicts with existing item
-    if payload.sku and payload.sku != item.sku:
-        existing = db.query(InventoryItem).filter(
-            InventoryItem.workspace_id == workspace_id,
-            InventoryItem.sku == payload.sku,
-            InventoryItem.id != item_id,
-            InventoryItem.is_deleted.is_(False)
-        ).first()
-        if existing:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Item with this SKU already exists")
-    
-    # Update fields
-    if payload.sku is not None:
-        item.sku = payload.sku
-    if payload.name is not None:
-        item.name = payload.name
-    if payload.description is not None:
-        item.description = payload.description
-    if payload.current_quantity is not None:
-        item.current_quantity = payload.current_quantity
-    if payload.reorder_threshold is not None:
-        item.reorder_threshold = payload.reorder_threshold
-    if payload.unit is not None:
-        item.unit = payload.unit
-    
+    out = InventoryOut.model_validate(item)
     db.commit()
-    db.refresh(item)
-    
-    return InventoryOut(
-        id=str(item.id),
-        sku=item.sku,
-        name=item.name,
-        description=item.description,
-        current_quantity=item.current_quantity,
-        reorder_threshold=item.reorder_threshold,
-        unit=item.unit,
-        created_at=item.created_at,
-        updated_at=item.updated_at,
-    )
+    return out
 
 @router.delete("/{workspace_id}/{item_id}")
 def delete_inventory_item(
@@ -177,7 +191,7 @@ def delete_inventory_item(
     current_user: dict = Depends(get_current_user),
 ):
     """Delete an inventory item (owner only)."""
-    workspace = _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
+    _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
     
     item = db.query(InventoryItem).filter(
         InventoryItem.id == item_id,
@@ -201,26 +215,31 @@ def adjust_inventory_quantity(
     current_user: dict = Depends(get_current_user),
 ):
     """Adjust inventory quantity (owner only)."""
-    workspace = _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
-    
-    item = db.query(InventoryItem).filter(
-        InventoryItem.id == item_id,
-        InventoryItem.workspace_id == workspace_id,
-        InventoryItem.is_deleted.is_(False)
-    ).first()
-    if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found")
-    
-    new_quantity = item.current_quantity + quantity_change
-    if new_quantity < 0:
+    _get_workspace_or_403(db, workspace_id, current_user, require_owner=True)
+    
+    # Single atomic UPDATE: the non-negative check runs in the database, so
+    # concurrent adjustments can't oversell.
+    new_quantity = db.scalar(
+        _ADJUST_QUANTITY_STMT,
+        {"item_id": item_id, "workspace_id": workspace_id, "delta": quantity_change},
+        execution_options={"synchronize_session": False},
+    )
+    if new_quantity is None:
+        found = db.scalar(
+            select(exists().where(
+                InventoryItem.id == item_id,
+                InventoryItem.workspace_id == workspace_id,
+                InventoryItem.is_deleted.is_(False),
+            ))
+        )
+        if not found:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot reduce quantity below 0")
-    
-    item.current_quantity = new_quantity
     db.commit()
     
     return {
         "message": "Quantity adjusted successfully",
-        "old_quantity": item.current_quantity - quantity_change,
+        "old_quantity": new_quantity - quantity_change,
         "new_quantity": new_quantity,
         "change": quantity_change
     }
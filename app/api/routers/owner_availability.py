@@ -154,7 +154,7 @@ def delete_blocked_slot(
     response_model=list[OwnerAvailabilitySlotOut],
 )
 # Removed the duplicate @router.get("/owner/availability") as it was inconsistent with the path prefix
-async def get_owner_availability(
+def get_owner_availability(
     workspace_id: UUID, # Add workspace_id as a path parameter
     from_date: date,     # Add from_date as a query parameter
     to_date: date,       # Add to_date as a query parameter
@@ -2,10 +2,12 @@
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, BackgroundTasks, status
+from fastapi import APIRouter, Depends, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api.dependencies.db import get_db
+from app.core.public_cache import cached_json
 from app.schemas.booking import (
     PublicBookingTypeOut,
     PublicAvailabilitySlotOut,
@@ -16,6 +18,10 @@ from app.services.public_booking_service import PublicBookingService
 
 router = APIRouter(prefix="/public", tags=["public-bookings"])
 
+_BOOKING_TYPES_ADAPTER = TypeAdapter(list[PublicBookingTypeOut])
+_AVAILABILITY_ADAPTER = TypeAdapter(list[PublicAvailabilitySlotOut])
+_DATES_ADAPTER = TypeAdapter(list[date])
+
 
 @router.get(
     "/{workspace_id}/booking-types",
@@ -26,7 +32,12 @@ def list_public_booking_types(
     db: Session = Depends(get_db),
 ):
     service = PublicBookingService(db)
-    return service.list_booking_types(workspace_id)
+    return cached_json(
+        workspace_id,
+        ("booking-types",),
+        _BOOKING_TYPES_ADAPTER,
+        lambda: service.list_booking_types(workspace_id),
+    )
 
 
 @router.get(
@@ -43,7 +54,12 @@ def get_public_availability_for_date(
     Returns availability slots for the given day (UTC) and booking type.
     """
     service = PublicBookingService(db)
-    return service.get_availability_for_date(workspace_id, slug, day)
+    return cached_json(
+        workspace_id,
+        ("availability", slug, day),
+        _AVAILABILITY_ADAPTER,
+        lambda: service.get_availability_for_date(workspace_id, slug, day),
+    )
 
 
 @router.get(
@@ -64,7 +80,12 @@ def get_public_availability_range(
     if to_date < from_date:
         return []
     service = PublicBookingService(db)
-    return service.get_available_dates_in_range(workspace_id, slug, from_date, to_date)
+    return cached_json(
+        workspace_id,
+        ("availability-range", slug, from_date, to_date),
+        _DATES_ADAPTER,
+        lambda: service.get_available_dates_in_range(workspace_id, slug, from_date, to_date),
+    )
 
 
 @router.post(
@@ -75,7 +96,6 @@ def get_public_availability_range(
 def create_public_booking(
     workspace_id: UUID,
     payload: PublicBookingCreateRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -83,8 +103,9 @@ def create_public_booking(
     - creates/uses contact
     - creates/uses conversation
     - creates booking (double-booking safe)
-    - queues confirmation email via BackgroundTasks
-    - logs events for analytics/automation
+    - logs events for analytics/automation (the booking.created event row is
+      committed with the booking, so follow-up work reads it from event_log
+      instead of running in this worker)
     """
     service = PublicBookingService(db)
-    return service.create_public_booking(workspace_id, payload, background_tasks)
\ No newline at end of file
+    return service.create_public_booking(workspace_id, payload)
\ No newline at end of file
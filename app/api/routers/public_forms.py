@@ -4,10 +4,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import and_, case, exists, or_, select
 
 from app.api.dependencies.db import get_db
-from app.models.workspace import Workspace, WorkspaceStatus
+from app.api.dependencies.workspace import ensure_workspace_active
+from app.core.ids import uuid7
+from app.core.public_cache import cached_json
 from app.models.form_template import FormTemplate
 from app.models.form_submission import FormSubmission
 from app.models.booking import Booking
@@ -15,7 +17,7 @@ from app.models.contact import Contact
 from app.models.conversation import Conversation, ConversationStatus, ChannelPreference
 from app.models.message import Message, MessageDirection, MessageChannel, MessageStatus
 from app.models.event_log import EventLog, ActorType
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from app.schemas.form import FormTemplateOut, FormSubmissionOut, PublicFormSubmitRequest, PublicContactRequest
 
 router = APIRouter(prefix="/public", tags=["public-forms"])
@@ -32,16 +34,8 @@ class BookingFormLinkOut(BaseModel):
     form_name: str | None
 
 
-def _get_active_workspace(db: Session, workspace_id: UUID) -> Workspace:
-    ws = db.scalar(
-        select(Workspace).where(
-            Workspace.id == workspace_id,
-            Workspace.status == WorkspaceStatus.active,
-        )
-    )
-    if not ws:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found or not active")
-    return ws
+_FORM_LINK_ADAPTER = TypeAdapter(BookingFormLinkOut)
+_FORM_TEMPLATE_ADAPTER = TypeAdapter(FormTemplateOut)
 
 
 @router.get(
@@ -54,26 +48,30 @@ def get_booking_form_link(
     db: Session = Depends(get_db),
 ):
     """Return the form template linked to this booking's type (if any). Used to send form link after booking."""
-    _get_active_workspace(db, workspace_id)
-    booking = db.scalar(
-        select(Booking).where(
-            Booking.id == booking_id,
-            Booking.workspace_id == workspace_id,
+
+    def build() -> BookingFormLinkOut:
+        ensure_workspace_active(db, workspace_id)
+        booking = db.scalar(
+            select(Booking).where(
+                Booking.id == booking_id,
+                Booking.workspace_id == workspace_id,
+            )
         )
-    )
-    if not booking:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-    template = db.scalar(
-        select(FormTemplate).where(
-            FormTemplate.workspace_id == workspace_id,
-            FormTemplate.booking_type_id == booking.booking_type_id,
-            FormTemplate.is_deleted.is_(False),
-            FormTemplate.active.is_(True),
+        if not booking:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+        template = db.scalar(
+            select(FormTemplate).where(
+                FormTemplate.workspace_id == workspace_id,
+                FormTemplate.booking_type_id == booking.booking_type_id,
+                FormTemplate.is_deleted.is_(False),
+                FormTemplate.active.is_(True),
+            )
         )
-    )
-    if not template:
-        return BookingFormLinkOut(form_template_id=None, form_name=None)
-    return BookingFormLinkOut(form_template_id=template.id, form_name=template.name)
+        if not template:
+            return BookingFormLinkOut(form_template_id=None, form_name=None)
+        return BookingFormLinkOut(form_template_id=template.id, form_name=template.name)
+
+    return cached_json(workspace_id, ("form-link", booking_id), _FORM_LINK_ADAPTER, build)
 
 
 @router.get(
@@ -86,18 +84,22 @@ def get_public_form_template(
     db: Session = Depends(get_db),
 ):
     """Return form template for public form completion page (no auth)."""
-    _get_active_workspace(db, workspace_id)
-    template = db.scalar(
-        select(FormTemplate).where(
-            FormTemplate.id == template_id,
-            FormTemplate.workspace_id == workspace_id,
-            FormTemplate.is_deleted.is_(False),
-            FormTemplate.active.is_(True),
+
+    def build() -> FormTemplateOut:
+        ensure_workspace_active(db, workspace_id)
+        template = db.scalar(
+            select(FormTemplate).where(
+                FormTemplate.id == template_id,
+                FormTemplate.workspace_id == workspace_id,
+                FormTemplate.is_deleted.is_(False),
+                FormTemplate.active.is_(True),
+            )
         )
-    )
-    if not template:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
-    return FormTemplateOut.model_validate(template)
+        if not template:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form not found")
+        return FormTemplateOut.model_validate(template)
+
+    return cached_json(workspace_id, ("form", template_id), _FORM_TEMPLATE_ADAPTER, build)
 
 
 @router.post(
@@ -113,57 +115,60 @@ def submit_public_form(
     """
     Submit a form for a booking. Validates that booking and contact belong to workspace and match.
     """
-    ws = _get_active_workspace(db, workspace_id)
-    template = db.scalar(
-        select(FormTemplate).where(
+    ensure_workspace_active(db, workspace_id)
+    # Template, matching booking and the duplicate-submission check in one
+    # round trip; the LEFT JOIN keeps "no template" distinguishable from
+    # "booking doesn't match".
+    already_submitted = exists().where(
+        FormSubmission.form_template_id == payload.template_id,
+        FormSubmission.booking_id == payload.booking_id,
+    )
+    row = db.execute(
+        select(FormTemplate, Booking.id, already_submitted)
+        .outerjoin(Booking, and_(
+            Booking.id == payload.booking_id,
+            Booking.workspace_id == workspace_id,
+            Booking.contact_id == payload.contact_id,
+        ))
+        .where(
             FormTemplate.id == payload.template_id,
             FormTemplate.workspace_id == workspace_id,
             FormTemplate.is_deleted.is_(False),
         )
-    )
-    if not template:
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Form template not found")
+    template, booking_id, is_duplicate = row
 
-    booking = db.scalar(
-        select(Booking).where(
-            Booking.id == payload.booking_id,
-            Booking.workspace_id == workspace_id,
-            Booking.contact_id == payload.contact_id,
-        )
-    )
-    if not booking:
+    if booking_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Booking not found or does not match contact",
         )
 
     # Avoid duplicate submission for same form+booking
-    existing = db.scalar(
-        select(FormSubmission).where(
-            FormSubmission.form_template_id == payload.template_id,
-            FormSubmission.booking_id == payload.booking_id,
-        )
-    )
-    if existing:
+    if is_duplicate:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Form already submitted for this booking",
         )
 
+    # Primary keys are generated here rather than at flush, so dependent rows
+    # can reference them and everything goes out in the one flush below.
     submitted_at = datetime.now(timezone.utc)
     submission = FormSubmission(
-        workspace_id=ws.id,
+        id=uuid7(),
+        workspace_id=workspace_id,
         form_template_id=template.id,
-        booking_id=booking.id,
+        booking_id=booking_id,
         contact_id=payload.contact_id,
         submitted_at=submitted_at,
         answers=payload.answers or {},
     )
     db.add(submission)
-    db.flush()
 
     ev = EventLog(
-        workspace_id=ws.id,
+        workspace_id=workspace_id,
         event_type="form.submitted",
         entity_type="form_submission",
         entity_id=str(submission.id),
@@ -174,15 +179,12 @@ def submit_public_form(
     db.add(ev)
 
     # Create an inbox message so owner can see form content and reply
-    contact = db.get(Contact, payload.contact_id)
+    # Contact.conversation is joined-loaded: contact and conversation in one query
+    contact = db.scalar(select(Contact).where(Contact.id == payload.contact_id))
     if contact:
-        conv = db.scalar(
-            select(Conversation).where(
-                Conversation.workspace_id == workspace_id,
-                Conversation.contact_id == contact.id,
-                Conversation.is_deleted.is_(False),
-            )
-        )
+        conv = contact.conversation
+        if conv is not None and (conv.is_deleted or conv.workspace_id != workspace_id):
+            conv = None
         if not conv:
             preferred = ChannelPreference.mixed
             if contact.primary_email and not contact.primary_phone:
@@ -190,37 +192,18 @@ def submit_public_form(
             elif contact.primary_phone and not contact.primary_email:
                 preferred = ChannelPreference.sms
             conv = Conversation(
-                workspace_id=ws.id,
+                id=uuid7(),
+                workspace_id=workspace_id,
                 contact_id=contact.id,
                 status=ConversationStatus.open,
                 channel_preference=preferred,
             )
             db.add(conv)
-            db.flush()
 
-        # Format form answers as readable text for inbox - show only customer's actual response
+        # The answer shown in the inbox was chosen when the template was saved
+        # (see forms._pick_inbox_field_id).
         answers = payload.answers or {}
-        schema_fields = (template.schema or {}).get("fields") or []
-
-        # Look for a message/notes field first, otherwise show first text field
-        customer_message = None
-
-        # Priority 1: Look for common message field names
-        message_fields = ['message', 'notes', 'special_requests', 'comments', 'additional_info']
-        for field_name in message_fields:
-            if field_name in answers and answers[field_name]:
-                customer_message = answers[field_name]
-                break
-
-        # Priority 2: If no message field, find first text field
-        if not customer_message:
-            for field in schema_fields:
-                if isinstance(field, dict):
-                    field_id = field.get("id")
-                    field_type = field.get("type", "")
-                    if field_id in answers and field_type in ["text", "textarea"]:
-                        customer_message = answers[field_id]
-                        break
+        customer_message = answers.get(template.inbox_field_id) if template.inbox_field_id else None
 
         # Format the inbox message
         if customer_message:
@@ -230,7 +213,7 @@ def submit_public_form(
             body_text = f"Form submitted: {template.name}"
 
         inbox_msg = Message(
-            workspace_id=ws.id,
+            workspace_id=workspace_id,
             conversation_id=conv.id,
             direction=MessageDirection.inbound,
             channel=MessageChannel.email,
@@ -245,9 +228,10 @@ def submit_public_form(
         now = datetime.now(timezone.utc)
         conv.last_message_at = now
 
+    db.flush()
+    out = FormSubmissionOut.model_validate(submission)
     db.commit()
-    db.refresh(submission)
-    return FormSubmissionOut.model_validate(submission)
+    return out
 
 
 @router.post(
@@ -263,43 +247,49 @@ def submit_public_contact(
     """
     Public contact form: create contact, open conversation, optionally add first message.
     """
-    ws = _get_active_workspace(db, workspace_id)
+    ensure_workspace_active(db, workspace_id)
     if not payload.email and not payload.phone:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="At least one of email or phone is required",
         )
 
-    # Match existing contact by email or phone
-    contact = None
+    # Match existing contact by email or phone (email wins ties) and pick up
+    # its open conversation in the same round trip.
+    match_filters = []
     if payload.email:
-        contact = db.scalar(
-            select(Contact).where(
-                Contact.workspace_id == workspace_id,
-                Contact.primary_email == payload.email,
-                Contact.is_deleted.is_(False),
-            )
-        )
-    if not contact and payload.phone:
-        contact = db.scalar(
-            select(Contact).where(
-                Contact.workspace_id == workspace_id,
-                Contact.primary_phone == payload.phone,
-                Contact.is_deleted.is_(False),
-            )
+        match_filters.append(Contact.primary_email == payload.email)
+    if payload.phone:
+        match_filters.append(Contact.primary_phone == payload.phone)
+    stmt = (
+        select(Contact)
+        .where(
+            Contact.workspace_id == workspace_id,
+            Contact.is_deleted.is_(False),
+            or_(*match_filters),
         )
+        .limit(1)
+    )
+    if payload.email:
+        stmt = stmt.order_by(case((Contact.primary_email == payload.email, 0), else_=1))
+    contact = db.scalar(stmt)
+    conversation = contact.conversation if contact else None
+    if conversation is not None and conversation.is_deleted:
+        conversation = None
 
     if not contact:
+        # Client-side ids: the conversation, message and events below can
+        # reference them without a flush per row.
         contact = Contact(
-            workspace_id=ws.id,
+            id=uuid7(),
+            workspace_id=workspace_id,
             full_name=payload.name,
             primary_email=payload.email,
             primary_phone=payload.phone,
         )
         db.add(contact)
-        db.flush()
         ev = EventLog(
-            workspace_id=ws.id,
+            workspace_id=workspace_id,
             event_type="contact.created",
             entity_type="contact",
             entity_id=str(contact.id),
@@ -314,13 +304,6 @@ def submit_public_contact(
         if payload.phone and not contact.primary_phone:
             contact.primary_phone = payload.phone
 
-    conversation = db.scalar(
-        select(Conversation).where(
-            Conversation.workspace_id == workspace_id,
-            Conversation.contact_id == contact.id,
-            Conversation.is_deleted.is_(False),
-        )
-    )
     if not conversation:
         preferred = ChannelPreference.mixed
         if contact.primary_email and not contact.primary_phone:
@@ -328,15 +311,15 @@ def submit_public_contact(
         elif contact.primary_phone and not contact.primary_email:
             preferred = ChannelPreference.sms
         conversation = Conversation(
-            workspace_id=ws.id,
+            id=uuid7(),
+            workspace_id=workspace_id,
             contact_id=contact.id,
             status=ConversationStatus.open,
             channel_preference=preferred,
         )
         db.add(conversation)
-        db.flush()
         ev = EventLog(
-            workspace_id=ws.id,
+            workspace_id=workspace_id,
             event_type="conversation.opened",
             entity_type="conversation",
             entity_id=str(conversation.id),
@@ -347,7 +330,7 @@ def submit_public_contact(
 
     if payload.message:
         msg = Message(
-            workspace_id=ws.id,
+            workspace_id=workspace_id,
             conversation_id=conversation.id,
             direction=MessageDirection.inbound,
             channel=MessageChannel.email,
@@ -360,11 +343,11 @@ def submit_public_contact(
         )
         db.add(msg)
 
-    db.commit()
-    db.refresh(contact)
-    db.refresh(conversation)
-    return PublicContactResponse(
+    # Read the ids before commit expires the instances.
+    response = PublicContactResponse(
         contact_id=contact.id,
         conversation_id=conversation.id,
         message="We'll be in touch soon.",
     )
+    db.commit()
+    return response
@@ -1,30 +1,55 @@
 # app/api/routers/staff.py
+import secrets
+import threading
+
+from cachetools import TTLCache
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import and_, exists, select
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.api.dependencies.db import get_db
 from app.api.dependencies.auth import get_current_user
+from app.core.security import hash_password
 from app.models.users import StaffUser, StaffRole
 from app.models.workspace import Workspace
 from app.schemas.staff import StaffCreate, StaffOut, StaffUpdate
+from app.api.dependencies.workspace import invalidate_workspace_access
+from app.services.auth_service import invalidate_staff_login
 
 router = APIRouter(prefix="/staff", tags=["staff"])
 
+_TEMP_PASSWORD_BYTES = 12
+
+# Emails that recently matched no staff user on /reset-password, so repeated
+# probes skip the database. Keyed by the exact email the lookup compares
+# against; create_staff drops its entry, the TTL covers other new users.
+_unknown_reset_emails: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+_unknown_reset_emails_lock = threading.Lock()
+_RESET_PASSWORD_MESSAGE = "If the email exists, a new temporary password has been generated."
+
+
 def _get_workspace_or_403(db: Session, workspace_id: str, current_user: dict) -> Workspace:
     """Get workspace and verify user is owner."""
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
-    if not workspace:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
-    
-    # Check if user is owner of this workspace
-    staff_user = db.query(StaffUser).filter(
-        StaffUser.workspace_id == workspace_id,
-        StaffUser.email == current_user.get("email"),
-        StaffUser.is_deleted.is_(False)
+    # One round trip; the outer join keeps "no workspace" (404) apart from
+    # "not a member" (403). Only the role is read from staff_users, so
+    # ix_staff_users_ws_email_active answers it with an index-only scan.
+    row = db.query(Workspace, StaffUser.role).outerjoin(
+        StaffUser,
+        and_(
+            StaffUser.workspace_id == Workspace.id,
+            StaffUser.email == current_user.get("email"),
+            StaffUser.is_deleted.is_(False),
+        ),
+    ).filter(
+        Workspace.id == workspace_id
     ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
+    workspace, staff_role = row
     
-    if not staff_user or staff_user.role != StaffRole.owner:
+    if staff_role != StaffRole.owner:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can manage staff")
     
     return workspace
@@ -38,22 +63,23 @@ def list_staff(
     """List all staff users for the workspace (owner only)."""
     workspace = _get_workspace_or_403(db, workspace_id, current_user)
     
-    staff_users = db.query(StaffUser).filter(
-        StaffUser.workspace_id == workspace_id,
-        StaffUser.is_deleted.is_(False)
+    rows = db.execute(
+        select(
+            StaffUser.id,
+            StaffUser.email,
+            StaffUser.full_name,
+            StaffUser.role,
+            StaffUser.is_active,
+            StaffUser.created_at,
+        ).where(
+            StaffUser.workspace_id == workspace_id,
+            StaffUser.is_deleted.is_(False)
+        )
     ).all()
     
-    return [
-        StaffOut(
-            id=str(staff.id),
-            email=staff.email,
-            full_name=staff.full_name,
-            role=staff.role,
-            is_active=staff.is_active,
-            created_at=staff.created_at,
-        )
-        for staff in staff_users
-    ]
+    # Plain column rows, no ORM hydration; response_model reads them by
+    # attribute (StaffOut has from_attributes)
+    return rows
 
 @router.post("/{workspace_id}")
 def create_staff(
@@ -66,18 +92,16 @@ def create_staff(
     workspace = _get_workspace_or_403(db, workspace_id, current_user)
     
     # Check if staff already exists
-    existing = db.query(StaffUser).filter(
+    existing = db.scalar(select(exists().where(
         StaffUser.workspace_id == workspace_id,
         StaffUser.email == payload.email,
         StaffUser.is_deleted.is_(False)
-    ).first()
+    )))
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Staff user already exists")
     
     # Create staff user with temporary password
-    import secrets
-    from app.core.security import hash_password
-    temp_password = secrets.token_urlsafe(12)
+    temp_password = secrets.token_urlsafe(_TEMP_PASSWORD_BYTES)
     hashed_password = hash_password(temp_password)
     
     staff_user = StaffUser(
@@ -92,6 +116,10 @@ def create_staff(
     db.add(staff_user)
     db.commit()
     db.refresh(staff_user)
+    invalidate_staff_login(staff_user.email)
+    invalidate_workspace_access(staff_user.workspace_id)
+    with _unknown_reset_emails_lock:
+        _unknown_reset_emails.pop(staff_user.email, None)
     
     # TODO: Send invitation email with temp password
     
@@ -126,13 +154,13 @@ def update_staff(
     
     # Don't allow changing owner role of the only owner
     if staff_user.role == StaffRole.owner and payload.role != StaffRole.owner:
-        other_owners = db.query(StaffUser).filter(
+        has_other_owner = db.scalar(select(exists().where(
             StaffUser.workspace_id == workspace_id,
             StaffUser.role == StaffRole.owner,
             StaffUser.id != staff_id,
             StaffUser.is_deleted.is_(False)
-        ).count()
-        if other_owners == 0:
+        )))
+        if not has_other_owner:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot remove owner role from the only owner")
     
     # Update fields
@@ -143,17 +171,14 @@ def update_staff(
     if payload.is_active is not None:
         staff_user.is_active = payload.is_active
     
+    # Build from the in-memory row before commit expires it (no refresh).
+    out = StaffOut.model_validate(staff_user)
+    email, staff_workspace_id = staff_user.email, staff_user.workspace_id
     db.commit()
-    db.refresh(staff_user)
+    invalidate_staff_login(email)
+    invalidate_workspace_access(staff_workspace_id)
     
-    return StaffOut(
-        id=str(staff_user.id),
-        email=staff_user.email,
-        full_name=staff_user.full_name,
-        role=staff_user.role,
-        is_active=staff_user.is_active,
-        created_at=staff_user.created_at,
-    )
+    return out
 
 @router.delete("/{workspace_id}/{staff_id}")
 def delete_staff(
@@ -175,17 +200,19 @@ def delete_staff(
     
     # Don't allow deleting the last owner
     if staff_user.role == StaffRole.owner:
-        other_owners = db.query(StaffUser).filter(
+        has_other_owner = db.scalar(select(exists().where(
             StaffUser.workspace_id == workspace_id,
             StaffUser.role == StaffRole.owner,
             StaffUser.id != staff_id,
             StaffUser.is_deleted.is_(False)
-        ).count()
-        if other_owners == 0:
+        )))
+        if not has_other_owner:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete the only owner")
     
     staff_user.is_deleted = True
     db.commit()
+    invalidate_staff_login(staff_user.email)
+    invalidate_workspace_access(staff_user.workspace_id)
     
     return {"message": "Staff user deleted successfully"}
 
@@ -195,22 +222,29 @@ def reset_password(
     db: Session = Depends(get_db),
 ):
     """Reset password for staff user (generates new temporary password)."""
+    with _unknown_reset_emails_lock:
+        known_unknown = email in _unknown_reset_emails
+    if known_unknown:
+        return {"message": _RESET_PASSWORD_MESSAGE}
+
     staff_user = db.query(StaffUser).filter(
         StaffUser.email == email,
         StaffUser.is_deleted.is_(False)
     ).first()
     
     if not staff_user:
+        with _unknown_reset_emails_lock:
+            _unknown_reset_emails[email] = None
         # Don't reveal if email exists for security
-        return {"message": "If the email exists, a new temporary password has been generated."}
+        return {"message": _RESET_PASSWORD_MESSAGE}
     
     # Generate new temporary password
-    import secrets
-    from app.core.security import hash_password
-    temp_password = secrets.token_urlsafe(12)
+    temp_password = secrets.token_urlsafe(_TEMP_PASSWORD_BYTES)
     staff_user.hashed_password = hash_password(temp_password)
     
     db.commit()
+    invalidate_staff_login(staff_user.email)
+    invalidate_workspace_access(staff_user.workspace_id)
     
     # TODO: Send email with new temporary password
     
@@ -4,6 +4,7 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from app.api.dependencies.auth import get_current_user
@@ -23,6 +24,8 @@ from app.schemas.workspace import (
     AvailabilitySlotCreateRequest,
 )
 from app.services.workspace_service import WorkspaceOnboardingService
+from app.core.ids import uuid7
+from app.core.public_cache import invalidate_public_cache
 from app.core.security import hash_password
 from datetime import timezone
 
@@ -154,6 +157,7 @@ def activate_workspace(
         )
     ws.status = WorkspaceStatus.active
     db.commit()
+    invalidate_public_cache(workspace_id)
     db.refresh(ws)
     return WorkspaceStatusResponse(status=ws.status.value, validation=validation)
 
@@ -169,26 +173,26 @@ def list_availability_slots(
 ):
     """List all availability slots for the workspace (owner/staff)."""
     ws = _get_workspace_or_403(db, workspace_id, current_user)
-    slots = db.query(AvailabilitySlot).join(BookingType).filter(
-        AvailabilitySlot.workspace_id == workspace_id,
-        BookingType.is_deleted.is_(False),
-    ).order_by(AvailabilitySlot.start_at).all()
-    result = []
-    for s in slots:
-        bt = db.query(BookingType).filter(BookingType.id == s.booking_type_id).first()
-        staff_name = None
-        if s.staff_user_id:
-            staff = db.query(StaffUser).filter(StaffUser.id == s.staff_user_id).first()
-            staff_name = staff.full_name if staff else None
-        result.append(AvailabilitySlotOut(
-            id=str(s.id),
-            booking_type_slug=bt.slug if bt else "",
-            booking_type_name=bt.name if bt else "",
-            start_at=s.start_at,
-            end_at=s.end_at,
-            staff_name=staff_name,
-        ))
-    return result
+    # One Core query for just the output columns; no ORM objects to hydrate.
+    rows = db.execute(
+        select(
+            AvailabilitySlot.id,
+            BookingType.slug.label("booking_type_slug"),
+            BookingType.name.label("booking_type_name"),
+            AvailabilitySlot.start_at,
+            AvailabilitySlot.end_at,
+            StaffUser.full_name.label("staff_name"),
+        )
+        .join(AvailabilitySlot.booking_type)
+        .outerjoin(AvailabilitySlot.staff_user)
+        .where(
+            AvailabilitySlot.workspace_id == workspace_id,
+            BookingType.is_deleted.is_(False),
+        )
+        .order_by(AvailabilitySlot.start_at)
+    ).all()
+    # response_model validates each Row by attribute (labels match field names)
+    return rows
 
 
 @router.post(
@@ -204,50 +208,54 @@ def create_availability_slot(
 ):
     """Add an availability slot (owner/staff)."""
     ws = _get_workspace_or_403(db, workspace_id, current_user)
-    bt = db.query(BookingType).filter(
-        BookingType.workspace_id == workspace_id,
-        BookingType.slug == payload.booking_type_slug,
-        BookingType.is_deleted.is_(False),
-    ).first()
-    if not bt:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking type not found")
-    staff_user_id = None
-    if payload.staff_email:
-        staff = db.query(StaffUser).filter(
-            StaffUser.workspace_id == workspace_id,
-            StaffUser.email == payload.staff_email,
-            StaffUser.is_deleted.is_(False),
-        ).first()
-        if not staff:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Staff user not found")
-        staff_user_id = staff.id
     start_at = payload.start_at
     end_at = payload.end_at
     # Keep database local time - don't convert to UTC
     if end_at <= start_at:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end_at must be after start_at")
-    slot = AvailabilitySlot(
+    # Booking type and (optional) staff member in one round trip; the LEFT
+    # JOIN keeps a missing staff member distinguishable from a missing type.
+    row = db.query(
+        BookingType.id, BookingType.slug, BookingType.name, StaffUser.id, StaffUser.full_name,
+    ).outerjoin(
+        StaffUser,
+        and_(
+            StaffUser.workspace_id == BookingType.workspace_id,
+            StaffUser.email == payload.staff_email,
+            StaffUser.is_deleted.is_(False),
+        ),
+    ).filter(
+        BookingType.workspace_id == workspace_id,
+        BookingType.slug == payload.booking_type_slug,
+        BookingType.is_deleted.is_(False),
+    ).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking type not found")
+    bt_id, bt_slug, bt_name, staff_user_id, staff_name = row
+    if payload.staff_email and staff_user_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Staff user not found")
+    # Client-side id: the INSERT goes out with the commit, and the response
+    # is built from values already in hand.
+    slot_id = uuid7()
+    db.add(AvailabilitySlot(
+        id=slot_id,
         workspace_id=workspace_id,
-        booking_type_id=bt.id,
+        booking_type_id=bt_id,
         staff_user_id=staff_user_id,
         start_at=start_at,
         end_at=end_at,
-    )
-    db.add(slot)
-    db.commit()
-    db.refresh(slot)
-    staff_name = None
-    if slot.staff_user_id:
-        staff = db.query(StaffUser).filter(StaffUser.id == slot.staff_user_id).first()
-        staff_name = staff.full_name if staff else None
-    return AvailabilitySlotOut(
-        id=str(slot.id),
-        booking_type_slug=bt.slug,
-        booking_type_name=bt.name,
-        start_at=slot.start_at,
-        end_at=slot.end_at,
+    ))
+    out = AvailabilitySlotOut(
+        id=str(slot_id),
+        booking_type_slug=bt_slug,
+        booking_type_name=bt_name,
+        start_at=start_at,
+        end_at=end_at,
         staff_name=staff_name,
     )
+    db.commit()
+    invalidate_public_cache(workspace_id)
+    return out
 
 
 @router.delete(
@@ -270,4 +278,5 @@ def delete_availability_slot(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Slot not found")
     db.delete(slot)
     db.commit()
+    invalidate_public_cache(workspace_id)
     return None
\ No newline at end of file
@@ -1,12 +1,16 @@
 # app/core/config.py
 from pydantic import field_validator
-from pydantic import AnyHttpUrl, AnyUrl, field_validator, ValidationInfo
-from typing import List, Optional
+from pydantic import AnyHttpUrl, AnyUrl, Field, TypeAdapter, field_validator, ValidationInfo
+from typing import List, Optional, Tuple
 
 from pydantic_settings import BaseSettings
 from pydantic import ValidationInfo
 
 
+_DEV_CORS_ORIGINS = ("http://localhost:3000", "http://127.0.0.1:3000")
+_HTTP_URL = TypeAdapter(AnyHttpUrl)
+
+
 class Settings(BaseSettings):
     # General
     app_env: str = "development"
@@ -14,6 +18,25 @@ class Settings(BaseSettings):
 
     # Database
     database_url: AnyUrl
+    # Connections per worker process; sized together with threadpool_tokens below.
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    # With threadpool_tokens capped at the pool size, a checkout only waits
+    # when connections are held outside the threadpool (async handlers,
+    # health probes); give such bursts time to drain, but still fail well
+    # before the default 30s. Recycle before managed Postgres idle-kills the socket.
+    db_pool_timeout: int = 15
+    db_pool_recycle: int = 1800
+    # Server-side cap on any single statement (ms), sent as a libpq startup
+    # option. Unset by default: PgBouncer-style poolers (e.g. Neon's pooled
+    # endpoint) reject startup options; set it on the role there instead.
+    db_statement_timeout_ms: Optional[int] = None
+    # Log SQL (staging): "[cached since ...]" vs "[generated in ...]" shows
+    # whether the compiled-statement cache is being hit.
+    db_echo: bool = False
+    # Compiled-statement LRU entries per engine; size it above the number of
+    # distinct statements so echo never shows hot queries being re-generated.
+    db_query_cache_size: int = 2000
 
     # External integrations
     gemini_api_key: str
@@ -31,20 +54,34 @@ class Settings(BaseSettings):
     # Security
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
+    # PEM public key for RS*/ES* algorithms (jwt_secret_key then holds the
+    # private key PEM). Derived from the private key when unset.
+    jwt_public_key: Optional[str] = None
     access_token_expires_minutes: int = 60 * 24
 
-    # CORS
-    cors_origins: List[AnyHttpUrl] = []
+    # Worker threads for sync (DB-bound) handlers. Each holds a pooled
+    # connection for its whole duration, so keep this <= db_pool_size +
+    # db_max_overflow: extra threads would only wait on the pool and then
+    # fail with a pool timeout. Raise all three together (or point
+    # database_url at PgBouncer and grow the pool).
+    threadpool_tokens: int = 40
+
+    # CORS: final, normalized allow-list (with credentials=True there is no "*")
+    cors_origins: Tuple[str, ...] = Field(default=(), validate_default=True)
 
     @field_validator("cors_origins", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v, info: ValidationInfo):
-        # pydantic-settings parses List from env as JSON; keep list or build from frontend_url
-        origins = list(v) if isinstance(v, list) else []
-        frontend = info.data.get("frontend_url") if info.data else None
-        if frontend and str(frontend) not in origins:
-            origins.append(str(frontend))
-        return origins
+        # pydantic-settings parses the env value as JSON; dev origins apply only
+        # when none are configured, frontend_url is always allowed.
+        data = info.data or {}
+        origins = [str(_HTTP_URL.validate_python(o)) for o in (v or [])]
+        if not origins and data.get("app_env") == "development":
+            origins = list(_DEV_CORS_ORIGINS)
+        if data.get("frontend_url"):
+            origins.append(str(data["frontend_url"]))
+        # Browsers send Origin without a trailing slash
+        return tuple(sorted({o.strip().rstrip("/") for o in origins if o.strip()}))
 
     class Config:
         env_file = ".env"
@@ -52,4 +89,3 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
-print("GEMINI_API_KEY loaded:", bool(settings.gemini_api_key))
@@ -1,4 +1,5 @@
 # app/core/database.py
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 
@@ -9,12 +10,32 @@ class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
 
-# For Neon / Render, keep pool small
+def _json_dumps(value) -> str:
+    # Non-str keys are stringified like stdlib json does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_connect_args: dict = {}
+if settings.db_statement_timeout_ms:
+    _connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+
+# Pool sizing comes from settings; on Neon / Render with many workers, point
+# database_url at the pooled (PgBouncer) endpoint rather than growing this.
 engine = create_engine(
     str(settings.database_url),
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=5,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    # Compiled-statement LRU; router queries are module-level bindparam
+    # statements so their cache keys are stable across requests.
+    query_cache_size=settings.db_query_cache_size,
+    connect_args=_connect_args,
+    echo=settings.db_echo,
+    # JSONB bind/result codec; psycopg2 registers the loader on each connection
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
     future=True,
 )
 
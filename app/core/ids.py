@@ -0,0 +1,21 @@
+# app/core/ids.py
+"""
+Primary-key generators.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    RFC 9562 UUIDv7: 48-bit unix-ms timestamp, then 74 random bits.
+
+    Ids minted later sort later, so inserts into a UUID primary key land on
+    the right-most B-tree leaf instead of a random page. Ordering within one
+    millisecond is random; don't rely on ids for strict sequencing.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value &= ~(0xF << 76) & ~(0x3 << 62)
+    value |= 0x7 << 76 | 0x2 << 62  # version 7, RFC 4122 variant
+    return uuid.UUID(int=value)
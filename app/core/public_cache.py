@@ -0,0 +1,46 @@
+# app/core/public_cache.py
+"""
+Read-through cache for unauthenticated public GET endpoints.
+
+Responses are stored as serialized JSON bytes keyed by
+``(workspace_id, route, *params)``, so a hit skips both the database and
+pydantic serialization. Owner/staff mutations that change what the public
+pages show call `invalidate_public_cache` for their workspace; the TTL
+bounds staleness across processes.
+"""
+import threading
+from typing import Any, Callable, Hashable
+from uuid import UUID
+
+from cachetools import TTLCache
+from fastapi import Response
+from pydantic import TypeAdapter
+
+_public_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_public_cache_lock = threading.Lock()
+
+
+def cached_json(
+    workspace_id: UUID,
+    key: tuple[Hashable, ...],
+    adapter: TypeAdapter,
+    build: Callable[[], Any],
+) -> Response:
+    """Return the cached body for `key`, or run `build` and cache its JSON."""
+    full_key = (workspace_id, *key)
+    with _public_cache_lock:
+        body = _public_cache.get(full_key)
+    if body is None:
+        # Errors raise out of build() and are never cached. by_alias matches
+        # FastAPI's response_model serialization.
+        body = adapter.dump_json(build(), by_alias=True)
+        with _public_cache_lock:
+            _public_cache[full_key] = body
+    return Response(content=body, media_type="application/json")
+
+
+def invalidate_public_cache(workspace_id: UUID) -> None:
+    """Drop every cached public response for a workspace."""
+    with _public_cache_lock:
+        for key in [k for k in _public_cache.keys() if k[0] == workspace_id]:
+            _public_cache.pop(key, None)
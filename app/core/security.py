@@ -4,38 +4,183 @@ Simple password hashing utilities.
 This implementation avoids external dependencies so Pyright and runtime
 environments don't require `passlib`. For production you would typically
 use a stronger hashing library like `passlib` or `argon2-cffi`.
+
+New hashes use scrypt (OpenSSL's memory-hard KDF via `hashlib`) and are
+stored as ``scrypt$<n>$<r>$<p>$<salt_hex>$<digest_hex>`` so the cost
+parameters travel with the hash. Older formats still verify and are flagged
+by `needs_rehash` so they can be upgraded on the next successful login:
+``pbkdf2_sha256$<iterations>$<salt_hex>$<digest_hex>`` and the original
+``salt_hex:digest_hex`` (PBKDF2-SHA256, fixed 100k iterations).
+
+The scrypt work factor ``n`` is calibrated once per process (see
+`_calibrated_scrypt_n`); verification always uses the parameters stored in
+the hash, so hashes from differently calibrated hosts stay valid.
 """
 
 from __future__ import annotations
 
 import hashlib
+import hmac
 import os
-from typing import Final
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Final
+
+from cachetools import TTLCache
+
+from app.core.config import settings
 
 
 _SALT_BYTES: Final[int] = 16
+_SCHEME: Final[str] = "scrypt"
+# Work factor bounds: 16 MiB to 32 MiB per hash (128 * r * n bytes)
+_SCRYPT_N: Final[int] = 2**14
+_SCRYPT_MAX_N: Final[int] = 2**15
+_SCRYPT_TARGET_SECONDS: Final[float] = 0.05
+_SCRYPT_R: Final[int] = 8
+_SCRYPT_P: Final[int] = 1
+_SCRYPT_DKLEN: Final[int] = 32
+_SCRYPT_MAXMEM: Final[int] = 64 * 1024 * 1024
+_PBKDF2_SCHEME: Final[str] = "pbkdf2_sha256"
+_LEGACY_ITERATIONS: Final[int] = 100_000
+
+# Recent successful verifications, so repeat logins skip the KDF. Keys are an
+# HMAC under a per-process random key (not a bare SHA-256 of the password),
+# and only successes are stored, so failed guesses always pay full cost.
+_verify_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_verify_cache_lock = threading.Lock()
+_VERIFY_CACHE_KEY: Final[bytes] = os.urandom(32)
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=_SCRYPT_MAXMEM,
+        dklen=_SCRYPT_DKLEN,
+    )
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
 
 
-def _hash_with_salt(password: str, salt: bytes) -> str:
-    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000)
-    return salt.hex() + ":" + digest.hex()
+@lru_cache(maxsize=1)
+def _calibrated_scrypt_n() -> int:
+    """
+    Largest power-of-two ``n`` within bounds that stays near the target time.
+
+    Measured lazily on the first `hash_password` call so startup doesn't pay
+    for it; never goes below `_SCRYPT_N`.
+    """
+    start = time.perf_counter()
+    _scrypt("calibration", b"\0" * _SALT_BYTES, _SCRYPT_N, _SCRYPT_R, _SCRYPT_P)
+    elapsed = time.perf_counter() - start
+    n = _SCRYPT_N
+    # scrypt time scales linearly with n
+    while n < _SCRYPT_MAX_N and elapsed * 2 <= _SCRYPT_TARGET_SECONDS:
+        n *= 2
+        elapsed *= 2
+    return n
+
+
+def _hash_with_salt(password: str, salt: bytes, n: int) -> tuple[bytes, bytes]:
+    return salt, _scrypt(password, salt, n, _SCRYPT_R, _SCRYPT_P)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using PBKDF2-HMAC-SHA256 with a random salt.
+    Hash a password using scrypt with a random salt.
     """
-    salt = os.urandom(_SALT_BYTES)
-    return _hash_with_salt(password, salt)
+    n = _calibrated_scrypt_n()
+    salt, digest = _hash_with_salt(password, os.urandom(_SALT_BYTES), n)
+    return f"{_SCHEME}${n}${_SCRYPT_R}${_SCRYPT_P}${salt.hex()}${digest.hex()}"
 
 
 def verify_password(password: str, stored: str) -> bool:
     """
-    Verify a password against a stored hash (salt:digest hex).
+    Verify a password against a stored hash (any supported format).
     """
+    cache_key = hmac.new(
+        _VERIFY_CACHE_KEY,
+        password.encode("utf-8") + b"\0" + stored.encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    with _verify_cache_lock:
+        if cache_key in _verify_cache:
+            return True
+    ok = _verify_uncached(password, stored)
+    if ok:
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = True
+    return ok
+
+
+def _verify_uncached(password: str, stored: str) -> bool:
+    # Compare raw digests in constant time; the stored hex is decoded once.
     try:
-        salt_hex, _ = stored.split(":", 1)
-        salt = bytes.fromhex(salt_hex)
-        return _hash_with_salt(password, salt) == stored
+        if stored.startswith(_SCHEME + "$"):
+            _, n, r, p, salt_hex, digest_hex = stored.split("$", 5)
+            computed = _scrypt(password, bytes.fromhex(salt_hex), int(n), int(r), int(p))
+        elif stored.startswith(_PBKDF2_SCHEME + "$"):
+            _, iterations, salt_hex, digest_hex = stored.split("$", 3)
+            computed = _pbkdf2(password, bytes.fromhex(salt_hex), int(iterations))
+        else:
+            salt_hex, digest_hex = stored.split(":", 1)
+            computed = _pbkdf2(password, bytes.fromhex(salt_hex), _LEGACY_ITERATIONS)
+        return hmac.compare_digest(computed, bytes.fromhex(digest_hex))
     except (ValueError, TypeError):
         return False
+
+
+def needs_rehash(stored: str) -> bool:
+    """
+    True when `stored` is not scrypt or uses parameters below the minimum.
+
+    Compared against the floor rather than the calibrated ``n`` so workers
+    that calibrated differently don't keep rehashing each other's hashes.
+    """
+    if not stored.startswith(_SCHEME + "$"):
+        return True
+    try:
+        _, n, r, p, _ = stored.split("$", 4)
+        return int(n) < _SCRYPT_N or int(r) < _SCRYPT_R or int(p) < _SCRYPT_P
+    except ValueError:
+        return True
+
+
+def _is_asymmetric(algorithm: str) -> bool:
+    return algorithm.startswith(("RS", "PS", "ES"))
+
+
+@lru_cache(maxsize=1)
+def get_jwt_signing_key() -> Any:
+    """
+    Key passed to `jwt.encode`, built once per process.
+
+    HS* gets the raw secret bytes; RS*/PS*/ES* get a parsed private key object
+    so PyJWT skips PEM parsing (and RSA key checks) on every token.
+    """
+    if not _is_asymmetric(settings.jwt_algorithm):
+        return settings.jwt_secret_key.encode("utf-8")
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    return load_pem_private_key(settings.jwt_secret_key.encode("utf-8"), password=None)
+
+
+@lru_cache(maxsize=1)
+def get_jwt_verifying_key() -> Any:
+    """
+    Key passed to `jwt.decode`, built once per process.
+    """
+    if not _is_asymmetric(settings.jwt_algorithm):
+        return settings.jwt_secret_key.encode("utf-8")
+    if settings.jwt_public_key:
+        from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+        return load_pem_public_key(settings.jwt_public_key.encode("utf-8"))
+    return get_jwt_signing_key().public_key()
@@ -1,5 +1,10 @@
 # app/main.py
+import importlib
+import logging
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logging import configure_logging
@@ -7,38 +12,36 @@ from app.core.config import settings
 from app.api.routers import auth, workspaces, public_bookings, public_forms, inbox, analytics, health, forms, bookings, staff, inventory
 from app.api.routers import owner_availability
 
-# Ensure all ORM models are loaded so SQLAlchemy can resolve relationship names
-import app.models  # noqa: F401
+# Explicit lists instead of "*": Starlette then answers preflights with a
+# fixed header set, and browsers may cache them for CORS_MAX_AGE seconds.
+_ALLOWED_HEADERS = ["authorization", "content-type", "x-requested-with"]
+_EXPOSED_HEADERS = ["x-next-cursor"]  # inbox message pagination
+_CORS_MAX_AGE = 86400
 
 
 def create_app() -> FastAPI:
     configure_logging(level=settings.log_level if hasattr(settings, "log_level") else "INFO")
+    logging.getLogger(__name__).info("gemini configured=%s", bool(settings.gemini_api_key))
+    # Ensure all ORM models are loaded so SQLAlchemy can resolve relationship
+    # names. Done here rather than at import so preloading servers fork after it.
+    importlib.import_module("app.models")
     app = FastAPI(
         title="Unified Operations Platform",
         version="0.1.0",
         debug=settings.debug,
+        # orjson encodes large list responses several times faster than stdlib json
+        default_response_class=ORJSONResponse,
     )
 
-    # CORS: with credentials=True we must list origins explicitly (no "*")
-    # Normalize to strings and strip trailing slash so they match browser Origin header
-    def _norm(o):
-        s = str(o).strip().rstrip("/")
-        return s or None
-
-    dev_origins = ["http://localhost:3000", "http://127.0.0.1:3000"]
-    raw = list(settings.cors_origins) if settings.cors_origins else []
-    if settings.app_env == "development" and not raw:
-        raw = dev_origins
-    if settings.frontend_url:
-        raw.append(settings.frontend_url)
-    origins = list({_norm(o) for o in raw if _norm(o)})
+    # CORS: origins are normalized once in Settings.assemble_cors_origins
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=["*"],
-        expose_headers=["*"],
+        allow_headers=_ALLOWED_HEADERS,
+        expose_headers=_EXPOSED_HEADERS,
+        max_age=_CORS_MAX_AGE,
     )
 
     # Routers
@@ -53,6 +56,14 @@ def create_app() -> FastAPI:
     app.include_router(forms.router, prefix="/api/v1/workspaces")
     app.include_router(bookings.router, prefix="/api/v1/workspaces")
     app.include_router(public_forms.router, prefix="/api/v1")
+
+    async def _configure_threadpool() -> None:
+        # Sync `def` handlers and dependencies share this limiter.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_tokens
+
+    app.add_event_handler("startup", _configure_threadpool)
+    app.add_event_handler("startup", bookings.start_resend_client)
+    app.add_event_handler("shutdown", bookings.close_resend_client)
     return app
 
 
@@ -0,0 +1,101 @@
+"""Create availability_rules / blocked_slots on the shared metadata
+
+Revision ID: add_availability_rules_blocked_slots
+Revises: messages_enums_to_varchar_check
+Create Date: 2026-10-15 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_availability_rules_blocked_slots'
+down_revision = 'messages_enums_to_varchar_check'
+branch_labels = None
+depends_on = None
+
+
+def _base_columns():
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('workspace_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('workspaces.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+# Tables created here carry this comment so the downgrade only drops those,
+# never tables (and rows) that predate the migration.
+_CREATED_MARKER = f'created by {revision}'
+
+
+def _adopt_existing(inspector, table):
+    # Tables created from the old standalone declarative_base had no
+    # timestamps and a workspace FK without ON DELETE CASCADE, which
+    # Workspace's passive_deletes relationships rely on.
+    existing = {c['name'] for c in inspector.get_columns(table)}
+    for name in ('created_at', 'updated_at'):
+        if name not in existing:
+            op.add_column(table, sa.Column(name, sa.DateTime(), server_default=sa.func.now(), nullable=False))
+    _replace_workspace_fk(inspector, table, ondelete='CASCADE')
+
+
+def _replace_workspace_fk(inspector, table, ondelete):
+    name = f'{table}_workspace_id_fkey'
+    for fk in inspector.get_foreign_keys(table):
+        if fk['constrained_columns'] == ['workspace_id']:
+            name = fk['name']
+            op.drop_constraint(name, table, type_='foreignkey')
+    op.create_foreign_key(name, table, 'workspaces', ['workspace_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if inspector.has_table('availability_rules'):
+        _adopt_existing(inspector, 'availability_rules')
+    else:
+        op.create_table(
+            'availability_rules',
+            *_base_columns(),
+            sa.Column('day_of_week', sa.Integer(), nullable=False),
+            sa.Column('start_time', sa.Time(), nullable=False),
+            sa.Column('end_time', sa.Time(), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=False),
+            comment=_CREATED_MARKER,
+        )
+    op.create_index('ix_availability_rules_workspace', 'availability_rules', ['workspace_id'])
+
+    if inspector.has_table('blocked_slots'):
+        _adopt_existing(inspector, 'blocked_slots')
+    else:
+        op.create_table(
+            'blocked_slots',
+            *_base_columns(),
+            sa.Column('start_datetime', sa.DateTime(), nullable=False),
+            sa.Column('end_datetime', sa.DateTime(), nullable=False),
+            sa.Column('reason', sa.String(), nullable=True),
+            comment=_CREATED_MARKER,
+        )
+    op.create_index('ix_blocked_slots_workspace_start', 'blocked_slots', ['workspace_id', 'start_datetime'])
+
+
+def _revert(inspector, table):
+    if inspector.get_table_comment(table).get('text') == _CREATED_MARKER:
+        op.drop_table(table)
+        return
+    # Pre-existing table: undo only what upgrade() added
+    op.drop_column(table, 'updated_at')
+    op.drop_column(table, 'created_at')
+    _replace_workspace_fk(inspector, table, ondelete=None)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    op.drop_index('ix_blocked_slots_workspace_start', table_name='blocked_slots')
+    _revert(inspector, 'blocked_slots')
+    op.drop_index('ix_availability_rules_workspace', table_name='availability_rules')
+    _revert(inspector, 'availability_rules')
@@ -0,0 +1,37 @@
+"""Replace availability_slots staff index with a covering range index
+
+Revision ID: add_availability_slots_range_cover_index
+Revises: add_availability_rules_blocked_slots
+Create Date: 2026-10-15 21:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_availability_slots_range_cover_index'
+down_revision = 'add_availability_rules_blocked_slots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_avail_ws_range_cover', 'availability_slots',
+                        ['workspace_id', 'start_at', 'end_at'],
+                        postgresql_include=['booking_type_id', 'staff_user_id'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_availability_workspace_staff_start', table_name='availability_slots',
+                      postgresql_concurrently=True)
+        # Index-only scans need a fresh visibility map
+        op.execute('VACUUM ANALYZE availability_slots')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_availability_workspace_staff_start', 'availability_slots',
+                        ['workspace_id', 'staff_user_id', 'start_at'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_avail_ws_range_cover', table_name='availability_slots',
+                      postgresql_concurrently=True)
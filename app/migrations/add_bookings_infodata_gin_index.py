@@ -0,0 +1,28 @@
+"""Add GIN (jsonb_path_ops) index on live bookings.infodata
+
+Revision ID: add_bookings_infodata_gin_index
+Revises: add_staff_users_ws_email_active_index
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bookings_infodata_gin_index'
+down_revision = 'add_staff_users_ws_email_active_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bookings_infodata_gin', 'bookings', ['infodata'],
+                        postgresql_using='gin', postgresql_ops={'infodata': 'jsonb_path_ops'},
+                        postgresql_where=sa.text('is_deleted = false'), postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_bookings_infodata_gin', table_name='bookings')
@@ -0,0 +1,32 @@
+"""Add GiST (workspace_id, booking_type_id, time_range) index on active bookings
+
+Revision ID: add_bookings_ws_type_range_gist_index
+Revises: add_bookings_infodata_gin_index
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bookings_ws_type_range_gist_index'
+down_revision = 'add_bookings_infodata_gin_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # GiST opclasses for the UUID equality columns (already required by
+    # excl_booking_per_staff_time, so normally a no-op)
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bookings_ws_type_range_gist', 'bookings',
+                        ['workspace_id', 'booking_type_id', 'time_range'],
+                        postgresql_using='gist', postgresql_where=sa.text("status <> 'cancelled'"),
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_bookings_ws_type_range_gist', table_name='bookings')
@@ -0,0 +1,28 @@
+"""Add partial index on conversations with automation not paused
+
+Revision ID: add_conversations_active_partial_index
+Revises: add_event_log_created_brin_index
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_conversations_active_partial_index'
+down_revision = 'add_event_log_created_brin_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_conv_active_by_ws', 'conversations', ['workspace_id', 'status'],
+                        postgresql_where=sa.text('automation_paused = false'),
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_conv_active_by_ws', table_name='conversations')
@@ -0,0 +1,28 @@
+"""Add BRIN index on event_log.created_at
+
+Revision ID: add_event_log_created_brin_index
+Revises: enum_columns_to_smallint
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_event_log_created_brin_index'
+down_revision = 'enum_columns_to_smallint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_events_created_brin', 'event_log', ['created_at'],
+                        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_events_created_brin', table_name='event_log')
@@ -0,0 +1,35 @@
+"""Add keyset pagination indexes to form_submissions
+
+Revision ID: add_form_submissions_keyset_indexes
+Revises: add_stay_active_after_submission
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_form_submissions_keyset_indexes'
+down_revision = 'add_stay_active_after_submission'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Back list_form_submissions' ORDER BY submitted_at DESC ... LIMIT, with and without the template filter
+    op.create_index(
+        'ix_form_submissions_ws_template_submitted',
+        'form_submissions',
+        ['workspace_id', 'form_template_id', sa.text('submitted_at DESC')],
+    )
+    op.create_index(
+        'ix_form_submissions_ws_submitted',
+        'form_submissions',
+        ['workspace_id', sa.text('submitted_at DESC')],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_form_submissions_ws_submitted', table_name='form_submissions')
+    op.drop_index('ix_form_submissions_ws_template_submitted', table_name='form_submissions')
@@ -0,0 +1,50 @@
+"""Add inbox_field_id to form_templates
+
+Revision ID: add_form_templates_inbox_field_id
+Revises: add_live_row_partial_indexes
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_form_templates_inbox_field_id'
+down_revision = 'add_live_row_partial_indexes'
+branch_labels = None
+depends_on = None
+
+# Mirrors app.api.routers.forms._pick_inbox_field_id at the time of writing
+_INBOX_MESSAGE_FIELDS = ('message', 'notes', 'special_requests', 'comments', 'additional_info')
+
+
+def _pick_inbox_field_id(schema):
+    fields = [f for f in ((schema or {}).get('fields') or []) if isinstance(f, dict)]
+    field_ids = {f.get('id') for f in fields}
+    for name in _INBOX_MESSAGE_FIELDS:
+        if name in field_ids:
+            return name
+    for field in fields:
+        if field.get('type', '') in ('text', 'textarea') and field.get('id'):
+            return field['id']
+    return None
+
+
+def upgrade():
+    op.add_column('form_templates', sa.Column('inbox_field_id', sa.String(length=255), nullable=True))
+
+    # Backfill existing templates
+    conn = op.get_bind()
+    rows = conn.execute(sa.text('SELECT id, schema FROM form_templates')).fetchall()
+    for template_id, schema in rows:
+        field_id = _pick_inbox_field_id(schema)
+        if field_id is not None:
+            conn.execute(
+                sa.text('UPDATE form_templates SET inbox_field_id = :field_id WHERE id = :id'),
+                {'field_id': field_id, 'id': template_id},
+            )
+
+
+def downgrade():
+    op.drop_column('form_templates', 'inbox_field_id')
@@ -0,0 +1,50 @@
+"""Add partial composite indexes for live-row (is_deleted = false) lookups
+
+Revision ID: add_live_row_partial_indexes
+Revises: inventory_partial_unique_sku
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_live_row_partial_indexes'
+down_revision = 'inventory_partial_unique_sku'
+branch_labels = None
+depends_on = None
+
+_LIVE = sa.text('is_deleted = false')
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_inventory_ws_name', 'inventory_items', ['workspace_id', 'name'],
+                        postgresql_where=_LIVE, postgresql_concurrently=True)
+        op.create_index('ix_contacts_ws_email_live', 'contacts', ['workspace_id', 'primary_email'],
+                        postgresql_where=_LIVE, postgresql_concurrently=True)
+        op.create_index('ix_contacts_ws_phone_live', 'contacts', ['workspace_id', 'primary_phone'],
+                        postgresql_where=_LIVE, postgresql_concurrently=True)
+        op.create_index('ix_form_templates_ws_booking_type', 'form_templates', ['workspace_id', 'booking_type_id'],
+                        postgresql_where=_LIVE, postgresql_concurrently=True)
+        op.create_index('ix_form_submissions_template_booking', 'form_submissions', ['form_template_id', 'booking_id'],
+                        postgresql_concurrently=True)
+
+        # Superseded by the partial indexes above
+        op.drop_index('ix_inventory_items_workspace_active', table_name='inventory_items', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_workspace_email', table_name='contacts', postgresql_concurrently=True)
+        op.drop_index('ix_contacts_workspace_phone', table_name='contacts', postgresql_concurrently=True)
+
+
+def downgrade():
+    op.create_index('ix_contacts_workspace_phone', 'contacts', ['workspace_id', 'primary_phone'])
+    op.create_index('ix_contacts_workspace_email', 'contacts', ['workspace_id', 'primary_email'])
+    op.create_index('ix_inventory_items_workspace_active', 'inventory_items', ['workspace_id', 'is_deleted'])
+
+    op.drop_index('ix_form_submissions_template_booking', table_name='form_submissions')
+    op.drop_index('ix_form_templates_ws_booking_type', table_name='form_templates')
+    op.drop_index('ix_contacts_ws_phone_live', table_name='contacts')
+    op.drop_index('ix_contacts_ws_email_live', table_name='contacts')
+    op.drop_index('ix_inventory_ws_name', table_name='inventory_items')
@@ -0,0 +1,29 @@
+"""Add covering (workspace_id, email, is_deleted) index on staff_users
+
+Revision ID: add_staff_users_ws_email_active_index
+Revises: add_form_templates_inbox_field_id
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_staff_users_ws_email_active_index'
+down_revision = 'add_form_templates_inbox_field_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # INCLUDE (PG 11+) lets role/owner checks run as index-only scans.
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_staff_users_ws_email_active', 'staff_users',
+                        ['workspace_id', 'email', 'is_deleted'],
+                        postgresql_include=['role', 'id'], postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_staff_users_ws_email_active', table_name='staff_users')
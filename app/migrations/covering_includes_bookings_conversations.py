@@ -0,0 +1,57 @@
+"""Add INCLUDE columns to bookings/conversations list indexes
+
+Revision ID: covering_includes_bookings_conversations
+Revises: uuid_pk_server_default
+Create Date: 2026-10-15 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'covering_includes_bookings_conversations'
+down_revision = 'uuid_pk_server_default'
+branch_labels = None
+depends_on = None
+
+# name -> (table, key columns, INCLUDE columns, partial predicate)
+INDEXES = {
+    'ix_bookings_workspace_status': (
+        'bookings', ['workspace_id', 'status', 'start_at'],
+        ['id', 'contact_id', 'booking_type_id'], None,
+    ),
+    'ix_conversations_workspace_status': (
+        'conversations', ['workspace_id', 'status', 'updated_at'],
+        ['id', 'contact_id', 'last_message_at', 'is_deleted'], None,
+    ),
+    'ix_conv_active_by_ws': (
+        'conversations', ['workspace_id', 'status'],
+        ['id'], 'automation_paused = false',
+    ),
+}
+
+
+def _rebuild(include: bool):
+    # Build the replacement under a temporary name, then swap it in, so the
+    # table is never without the index. CONCURRENTLY needs autocommit.
+    with op.get_context().autocommit_block():
+        for name, (table, columns, include_cols, where) in INDEXES.items():
+            tmp = f'{name}_tmp'
+            op.create_index(tmp, table, columns,
+                            postgresql_include=include_cols if include else [],
+                            postgresql_where=sa.text(where) if where else None,
+                            postgresql_concurrently=True)
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.execute(f'ALTER INDEX {tmp} RENAME TO {name}')
+        # Index-only scans need a fresh visibility map
+        op.execute('VACUUM ANALYZE bookings')
+        op.execute('VACUUM ANALYZE conversations')
+
+
+def upgrade():
+    _rebuild(include=True)
+
+
+def downgrade():
+    _rebuild(include=False)
@@ -0,0 +1,69 @@
+"""Store booking/conversation/automation/event enums as SMALLINT ordinals
+
+Revision ID: enum_columns_to_smallint
+Revises: add_bookings_ws_type_range_gist_index
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'enum_columns_to_smallint'
+down_revision = 'add_bookings_ws_type_range_gist_index'
+branch_labels = None
+depends_on = None
+
+# (table, column, PG enum type, members in declaration order). The position
+# in each tuple is the stored ordinal (app.core.types.OrdinalEnum), so these
+# must match the Python enums at the time of writing. The labels are the enum
+# member *names* (what sqlalchemy.Enum stores), not their values: hence
+# 'import_' for BookingSource.import_ = "import".
+_COLUMNS = (
+    ('bookings', 'status', 'booking_status',
+     ('pending', 'confirmed', 'cancelled', 'completed', 'no_show')),
+    ('bookings', 'source', 'booking_source', ('public_page', 'internal', 'import_')),
+    ('conversations', 'status', 'conversation_status', ('open', 'closed', 'snoozed')),
+    ('conversations', 'channel_preference', 'channel_preference', ('email', 'sms', 'mixed')),
+    ('automation_runs', 'status', 'automation_run_status',
+     ('pending', 'running', 'succeeded', 'failed', 'skipped')),
+    ('event_log', 'actor_type', 'event_actor_type', ('system', 'staff', 'contact', 'integration')),
+)
+
+_CANCELLED = 2  # BookingStatus.cancelled
+
+
+def _drop_range_index():
+    # Its predicate compares status, so it can't survive the type change
+    op.drop_index('ix_bookings_ws_type_range_gist', table_name='bookings')
+
+
+def _create_range_index(predicate):
+    op.create_index('ix_bookings_ws_type_range_gist', 'bookings',
+                    ['workspace_id', 'booking_type_id', 'time_range'],
+                    postgresql_using='gist', postgresql_where=predicate)
+
+
+def upgrade():
+    _drop_range_index()
+    for table, column, enum_name, members in _COLUMNS:
+        cases = ' '.join(f"WHEN '{m}' THEN {i}" for i, m in enumerate(members))
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint '
+            f'USING (CASE {column}::text {cases} END)'
+        )
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+    _create_range_index(f'status <> {_CANCELLED}')
+
+
+def downgrade():
+    _drop_range_index()
+    for table, column, enum_name, members in _COLUMNS:
+        labels = ', '.join(f"'{m}'" for m in members)
+        cases = ' '.join(f"WHEN {i} THEN '{m}'" for i, m in enumerate(members))
+        op.execute(f'CREATE TYPE {enum_name} AS ENUM ({labels})')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} '
+            f'USING (CASE {column} {cases} END)::{enum_name}'
+        )
+    _create_range_index("status <> 'cancelled'")
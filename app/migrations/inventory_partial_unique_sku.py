@@ -0,0 +1,33 @@
+"""Make inventory SKU uniqueness apply to live items only
+
+Revision ID: inventory_partial_unique_sku
+Revises: add_form_submissions_keyset_indexes
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'inventory_partial_unique_sku'
+down_revision = 'add_form_submissions_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial unique index replaces the table-wide constraint; it is also the ON CONFLICT target on create
+    op.create_index(
+        'inventory_ws_sku_uq',
+        'inventory_items',
+        ['workspace_id', 'sku'],
+        unique=True,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    op.drop_constraint('uq_inventory_sku_ws', 'inventory_items', type_='unique')
+
+
+def downgrade():
+    op.create_unique_constraint('uq_inventory_sku_ws', 'inventory_items', ['workspace_id', 'sku'])
+    op.drop_index('inventory_ws_sku_uq', table_name='inventory_items')
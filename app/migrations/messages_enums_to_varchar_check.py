@@ -0,0 +1,40 @@
+"""Store message direction/channel/status as VARCHAR(16) with CHECK constraints
+
+Revision ID: messages_enums_to_varchar_check
+Revises: add_conversations_active_partial_index
+Create Date: 2026-10-15 19:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'messages_enums_to_varchar_check'
+down_revision = 'add_conversations_active_partial_index'
+branch_labels = None
+depends_on = None
+
+# (column, PG enum type, labels)
+_COLUMNS = (
+    ('direction', 'message_direction', ('inbound', 'outbound')),
+    ('channel', 'message_channel', ('email', 'sms')),
+    ('status', 'message_status', ('queued', 'sent', 'delivered', 'failed')),
+)
+
+
+def _labels(labels):
+    return ', '.join(f"'{label}'" for label in labels)
+
+
+def upgrade():
+    for column, enum_name, labels in _COLUMNS:
+        op.execute(f'ALTER TABLE messages ALTER COLUMN {column} TYPE varchar(16) USING {column}::text')
+        op.create_check_constraint(f'ck_messages_{column}', 'messages', f'{column} IN ({_labels(labels)})')
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+
+
+def downgrade():
+    for column, enum_name, labels in _COLUMNS:
+        op.drop_constraint(f'ck_messages_{column}', 'messages', type_='check')
+        op.execute(f'CREATE TYPE {enum_name} AS ENUM ({_labels(labels)})')
+        op.execute(f'ALTER TABLE messages ALTER COLUMN {column} TYPE {enum_name} USING {column}::{enum_name}')
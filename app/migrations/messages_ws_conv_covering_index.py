@@ -0,0 +1,37 @@
+"""Replace messages conversation index with a covering one
+
+Revision ID: messages_ws_conv_covering_index
+Revises: covering_includes_bookings_conversations
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'messages_ws_conv_covering_index'
+down_revision = 'covering_includes_bookings_conversations'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_messages_ws_conv_created', 'messages',
+                        ['workspace_id', 'conversation_id', 'created_at'],
+                        postgresql_include=['direction'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_messages_workspace_conversation', table_name='messages',
+                      postgresql_concurrently=True)
+        # Index-only scans need a fresh visibility map
+        op.execute('VACUUM ANALYZE messages')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_messages_workspace_conversation', 'messages',
+                        ['workspace_id', 'conversation_id', 'created_at'],
+                        postgresql_concurrently=True)
+        op.drop_index('ix_messages_ws_conv_created', table_name='messages',
+                      postgresql_concurrently=True)
@@ -0,0 +1,69 @@
+"""Store message/staff/workspace/email-provider enums as SMALLINT ordinals
+
+Revision ID: remaining_enums_to_smallint
+Revises: messages_ws_conv_covering_index
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'remaining_enums_to_smallint'
+down_revision = 'messages_ws_conv_covering_index'
+branch_labels = None
+depends_on = None
+
+# (column, members in declaration order); VARCHAR(16) + CHECK since
+# messages_enums_to_varchar_check. Position = stored ordinal.
+_MESSAGE_COLUMNS = (
+    ('direction', ('inbound', 'outbound')),
+    ('channel', ('email', 'sms')),
+    ('status', ('queued', 'sent', 'delivered', 'failed')),
+)
+
+# (table, column, PG enum type, members in declaration order)
+_NATIVE_COLUMNS = (
+    ('staff_users', 'role', 'staff_role', ('owner', 'staff')),
+    ('workspaces', 'status', 'workspace_status',
+     ('draft', 'pending_validation', 'active', 'suspended')),
+    ('workspace_email_configs', 'provider', 'email_provider', ('resend',)),
+)
+
+
+def _to_smallint(table, column, members):
+    cases = ' '.join(f"WHEN '{m}' THEN {i}" for i, m in enumerate(members))
+    op.execute(
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint '
+        f'USING (CASE {column}::text {cases} END)'
+    )
+
+
+def _cases_to_label(column, members):
+    return ' '.join(f"WHEN {i} THEN '{m}'" for i, m in enumerate(members))
+
+
+def upgrade():
+    for column, members in _MESSAGE_COLUMNS:
+        op.drop_constraint(f'ck_messages_{column}', 'messages', type_='check')
+        _to_smallint('messages', column, members)
+    for table, column, enum_name, members in _NATIVE_COLUMNS:
+        _to_smallint(table, column, members)
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+
+
+def downgrade():
+    for column, members in _MESSAGE_COLUMNS:
+        labels = ', '.join(f"'{m}'" for m in members)
+        op.execute(
+            f'ALTER TABLE messages ALTER COLUMN {column} TYPE varchar(16) '
+            f'USING (CASE {column} {_cases_to_label(column, members)} END)'
+        )
+        op.create_check_constraint(f'ck_messages_{column}', 'messages', f'{column} IN ({labels})')
+    for table, column, enum_name, members in _NATIVE_COLUMNS:
+        labels = ', '.join(f"'{m}'" for m in members)
+        op.execute(f'CREATE TYPE {enum_name} AS ENUM ({labels})')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} '
+            f'USING (CASE {column} {_cases_to_label(column, members)} END)::{enum_name}'
+        )
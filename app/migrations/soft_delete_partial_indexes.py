@@ -0,0 +1,54 @@
+"""Replace is_deleted/is_active key columns with partial indexes
+
+Revision ID: soft_delete_partial_indexes
+Revises: remaining_enums_to_smallint
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'soft_delete_partial_indexes'
+down_revision = 'remaining_enums_to_smallint'
+branch_labels = None
+depends_on = None
+
+# (new name, table, columns, predicate)
+_NEW = (
+    ('ix_staff_ws_live', 'staff_users', ['workspace_id'], 'is_deleted = false'),
+    ('ix_booking_types_ws_name_live', 'booking_types', ['workspace_id', 'name'], 'is_deleted = false'),
+    ('ix_automation_rules_ws_event_live', 'automation_rules', ['workspace_id', 'event_type'],
+     'is_deleted = false AND is_active = true'),
+    ('ix_form_templates_ws_name_live', 'form_templates', ['workspace_id', 'name'], 'is_deleted = false'),
+)
+
+# (old name, table, columns)
+_OLD = (
+    ('ix_staff_workspace_active', 'staff_users', ['workspace_id', 'is_active']),
+    ('ix_booking_types_workspace_active', 'booking_types', ['workspace_id', 'is_deleted']),
+    ('ix_automation_rules_workspace_event_active', 'automation_rules',
+     ['workspace_id', 'event_type', 'is_deleted', 'is_active']),
+    ('ix_form_templates_workspace_active', 'form_templates', ['workspace_id', 'is_deleted']),
+    # Redundant with uq_workspace_email_config_per_ws
+    ('ix_workspace_email_config_workspace_active', 'workspace_email_configs', ['workspace_id', 'is_active']),
+)
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns, predicate in _NEW:
+            op.create_index(name, table, columns, postgresql_where=sa.text(predicate),
+                            postgresql_concurrently=True)
+        for name, table, _ in _OLD:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in _OLD:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, table, _, _ in _NEW:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,36 @@
+"""Default every UUID primary key to gen_random_uuid()
+
+Revision ID: uuid_pk_server_default
+Revises: add_availability_slots_range_cover_index
+Create Date: 2026-10-15 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'uuid_pk_server_default'
+down_revision = 'add_availability_slots_range_cover_index'
+branch_labels = None
+depends_on = None
+
+# gen_random_uuid() is built in since PostgreSQL 13; no pgcrypto needed
+TABLES = (
+    'alerts', 'automation_rules', 'automation_runs', 'availability_rules',
+    'availability_slots', 'blocked_slots', 'booking_types', 'bookings',
+    'contacts', 'conversations', 'event_log', 'form_submissions',
+    'form_templates', 'inventory_items', 'inventory_usage_logs', 'messages',
+    'staff_users', 'workspace_email_configs', 'workspaces',
+)
+
+
+def upgrade():
+    # Metadata-only change: no table rewrite, existing ids are untouched
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
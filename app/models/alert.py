@@ -85,7 +85,7 @@ class Alert(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     )
     acknowledged_at: Mapped[datetime | None]
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="alerts")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="alerts", lazy="raise_on_sql")
     acknowledged_by: Mapped["StaffUser | None"] = relationship(
         "StaffUser", back_populates="acknowledged_alerts"
     )
\ No newline at end of file
@@ -1,7 +1,7 @@
 # app/models/automation_rule.py
 from __future__ import annotations
 
-from sqlalchemy import String, Boolean, Integer, Index
+from sqlalchemy import String, Boolean, Integer, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -38,12 +38,12 @@ class AutomationRule(
 ):
     __tablename__ = "automation_rules"
     __table_args__ = (
+        # Dispatch only ever looks at live, enabled rules
         Index(
-            "ix_automation_rules_workspace_event_active",
+            "ix_automation_rules_ws_event_live",
             "workspace_id",
             "event_type",
-            "is_deleted",
-            "is_active",
+            postgresql_where=text("is_deleted = false AND is_active = true"),
         ),
     )
 
@@ -53,9 +53,13 @@ class AutomationRule(
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
     priority: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
-    conditions: Mapped[dict | None] = mapped_column(JSONB)  # filter spec
+    # Filter spec, evaluated in Python (automation_compiler.conditions_predicate)
+    # on rules already narrowed by the index above, so it is deliberately not
+    # indexed. If a condition key ever moves into SQL, give it an expression
+    # BTREE on (conditions->>'key'); GIN does not serve ->> equality.
+    conditions: Mapped[dict | None] = mapped_column(JSONB)
     actions: Mapped[dict] = mapped_column(JSONB, nullable=False)  # list of actions
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="automation_rules"
+        "Workspace", back_populates="automation_rules", lazy="raise_on_sql"
     )
\ No newline at end of file
@@ -3,12 +3,13 @@ from __future__ import annotations
 
 from datetime import datetime
 import uuid
-from sqlalchemy import String, Enum, ForeignKey, Index
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin
 
 
@@ -61,12 +62,12 @@ class AutomationRun(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     )
 
     status: Mapped[AutomationRunStatus] = mapped_column(
-        Enum(AutomationRunStatus, name="automation_run_status"),
+        OrdinalEnum(AutomationRunStatus),
         nullable=False,
         default=AutomationRunStatus.pending,
     )
     error_message: Mapped[str | None] = mapped_column(String(1024))
-    run_metadata: Mapped[dict | None] = mapped_column(JSONB, name="metadata")
+    run_metadata: Mapped[dict | None] = mapped_column(JSONB, name="metadata", deferred=True)  # unread; undefer() to load
 
     rule: Mapped["AutomationRule"] = relationship("AutomationRule")
     event: Mapped["EventLog"] = relationship("EventLog")
\ No newline at end of file
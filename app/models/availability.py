@@ -1,46 +1,51 @@
-from sqlalchemy import Column, Integer, String, Time, Boolean, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
-import uuid
+# app/models/availability.py
+from __future__ import annotations
 
-Base = declarative_base()
+from datetime import datetime, time
+from typing import TYPE_CHECKING
 
-class AvailabilityRule(Base):
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Time
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from app.core.database import Base
+from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin
+
+if TYPE_CHECKING:
+    from .workspace import Workspace
+
+
+class AvailabilityRule(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "availability_rules"
+    __table_args__ = (
+        Index("ix_availability_rules_workspace", "workspace_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False)
-    day_of_week = Column(Integer, nullable=False) # 0=Monday, 6=Sunday
-    start_time = Column(Time, nullable=False)
-    end_time = Column(Time, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
+    day_of_week: Mapped[int] = mapped_column(Integer, nullable=False)  # 0=Monday, 6=Sunday
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Optional: Add relationship to Workspace if you have a Workspace model
-    workspace = relationship("Workspace", back_populates="availability_rules")
+    workspace: Mapped["Workspace"] = relationship(
+        "Workspace", back_populates="availability_rules", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<AvailabilityRule(id={self.id}, day_of_week={self.day_of_week}, start_time={self.start_time}, end_time={self.end_time})>"
 
-class BlockedSlot(Base):
+
+class BlockedSlot(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "blocked_slots"
+    __table_args__ = (
+        Index("ix_blocked_slots_workspace_start", "workspace_id", "start_datetime"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    workspace_id = Column(UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False)
-    start_datetime = Column(DateTime, nullable=False)
-    end_datetime = Column(DateTime, nullable=False)
-    reason = Column(String, nullable=True)
+    start_datetime: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_datetime: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    reason: Mapped[str | None] = mapped_column(String, nullable=True)
 
-    # Optional: Add relationship to Workspace
-    workspace = relationship("Workspace", back_populates="blocked_slots")
+    workspace: Mapped["Workspace"] = relationship(
+        "Workspace", back_populates="blocked_slots", lazy="raise_on_sql"
+    )
 
     def __repr__(self):
         return f"<BlockedSlot(id={self.id}, start_datetime={self.start_datetime}, end_datetime={self.end_datetime})>"
-
-# You would also need a 'workspaces' table and model if you don't have one already
-class Workspace(Base):
-     __tablename__ = "workspaces"
-     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-     name = Column(String, nullable=False)
-     availability_rules = relationship("AvailabilityRule", back_populates="workspace")
-     blocked_slots = relationship("BlockedSlot", back_populates="workspace")
\ No newline at end of file
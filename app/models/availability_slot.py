@@ -22,11 +22,14 @@ if TYPE_CHECKING:
 class AvailabilitySlot(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "availability_slots"
     __table_args__ = (
+        # Both range bounds in the key and the other filter/output columns in
+        # the leaf: day-window availability reads are index-only scans.
         Index(
-            "ix_availability_workspace_staff_start",
+            "ix_avail_ws_range_cover",
             "workspace_id",
-            "staff_user_id",
             "start_at",
+            "end_at",
+            postgresql_include=["booking_type_id", "staff_user_id"],
         ),
     )
 
@@ -43,7 +46,7 @@ class AvailabilitySlot(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     end_at: Mapped[datetime] = mapped_column(nullable=False)
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="availability_slots"
+        "Workspace", back_populates="availability_slots", lazy="raise_on_sql"
     )
     booking_type: Mapped["BookingType"] = relationship(
         "BookingType", back_populates="availability_slots"
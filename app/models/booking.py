@@ -6,12 +6,13 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Enum, ForeignKey, Index
+from sqlalchemy import String, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import TSTZRANGE, JSONB
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum, enum_ordinal
 from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteMixin
 
 if TYPE_CHECKING:
@@ -55,11 +56,36 @@ class Booking(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteM
             "contact_id",
             "start_at",
         ),
+        # INCLUDE covers the dashboard form stats and the pending-forms list,
+        # so their bookings side is an index-only scan.
         Index(
             "ix_bookings_workspace_status",
             "workspace_id",
             "status",
             "start_at",
+            postgresql_include=["id", "contact_id", "booking_type_id"],
+        ),
+        # Overlap check for new public bookings (type-wide, non-cancelled).
+        # The exclusion constraint's index leads with assigned_staff_id, which
+        # that check doesn't filter on. Needs btree_gist for the UUID columns.
+        Index(
+            "ix_bookings_ws_type_range_gist",
+            "workspace_id",
+            "booking_type_id",
+            "time_range",
+            postgresql_using="gist",
+            postgresql_where=text(f"status <> {enum_ordinal(BookingStatus.cancelled)}"),
+        ),
+        # Containment filters on live bookings: filter with
+        # `Booking.infodata.contains({...})` (@>) rather than ['k'].astext ==
+        # so this index applies. jsonb_path_ops only supports @>, but is
+        # smaller and faster for it than the default jsonb_ops.
+        Index(
+            "ix_bookings_infodata_gin",
+            "infodata",
+            postgresql_using="gin",
+            postgresql_ops={"infodata": "jsonb_path_ops"},
+            postgresql_where=text("is_deleted = false"),
         ),
     )
 
@@ -88,31 +114,41 @@ class Booking(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteM
     )
 
     status: Mapped[BookingStatus] = mapped_column(
-        Enum(BookingStatus, name="booking_status"),
+        OrdinalEnum(BookingStatus),
         default=BookingStatus.pending,
         nullable=False,
     )
     source: Mapped[BookingSource] = mapped_column(
-        Enum(BookingSource, name="booking_source"),
+        OrdinalEnum(BookingSource),
         default=BookingSource.public_page,
         nullable=False,
     )
     location: Mapped[str | None] = mapped_column(String(255))
     notes: Mapped[str | None]
-    infodata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Deferred: no list/detail path reads it; undefer(Booking.infodata) if one does
+    infodata: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="bookings")
-    contact: Mapped["Contact"] = relationship("Contact", back_populates="bookings")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="bookings", lazy="raise_on_sql")
+    contact: Mapped["Contact"] = relationship(
+        "Contact", back_populates="bookings", lazy="raise_on_sql"
+    )
     booking_type: Mapped["BookingType"] = relationship(
-        "BookingType", back_populates="bookings"
+        "BookingType", back_populates="bookings", lazy="raise_on_sql"
     )
     assigned_staff: Mapped["StaffUser | None"] = relationship(
-        "StaffUser", back_populates="bookings", foreign_keys=[assigned_staff_id]
+        "StaffUser",
+        back_populates="bookings",
+        foreign_keys=[assigned_staff_id],
+        lazy="raise_on_sql",
     )
     conversation: Mapped["Conversation | None"] = relationship("Conversation")
     form_submissions: Mapped[list["FormSubmission"]] = relationship(
-        "FormSubmission", back_populates="booking"
+        "FormSubmission",
+        back_populates="booking",
+        passive_deletes=True,
     )
     inventory_usage_logs: Mapped[list["InventoryUsageLog"]] = relationship(
-        "InventoryUsageLog", back_populates="booking"
+        "InventoryUsageLog",
+        back_populates="booking",
+        passive_deletes=True,
     )
\ No newline at end of file
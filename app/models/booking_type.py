@@ -1,7 +1,7 @@
 # app/models/booking_type.py
 from __future__ import annotations
 
-from sqlalchemy import String, Boolean, UniqueConstraint, Index
+from sqlalchemy import String, Boolean, UniqueConstraint, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -34,24 +34,38 @@ class BookingType(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDel
     __tablename__ = "booking_types"
     __table_args__ = (
         UniqueConstraint("workspace_id", "slug", name="uq_booking_type_slug_per_ws"),
-        Index("ix_booking_types_workspace_active", "workspace_id", "is_deleted"),
+        # Live types by workspace, in the public list's name order
+        Index(
+            "ix_booking_types_ws_name_live",
+            "workspace_id",
+            "name",
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None]
+    # Informational only: availability is carved into fixed one-hour chunks
+    # from the slot bounds (see public_booking_service), and nothing turns
+    # this into a timedelta/interval. Add a STORED make_interval() generated
+    # column only once a query actually does start_at + duration.
     duration_minutes: Mapped[int]
-    infodata: Mapped[dict | None] = mapped_column(JSONB)
+    infodata: Mapped[dict | None] = mapped_column(JSONB, deferred=True)  # unread; undefer() to load
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="booking_types"
+        "Workspace", back_populates="booking_types", lazy="raise_on_sql"
     )
     bookings: Mapped[list["Booking"]] = relationship(
         "Booking", back_populates="booking_type"
     )
     availability_slots: Mapped[list["AvailabilitySlot"]] = relationship(
-        "AvailabilitySlot", back_populates="booking_type"
+        "AvailabilitySlot",
+        back_populates="booking_type",
+        passive_deletes=True,
     )
     form_templates: Mapped[list["FormTemplate"]] = relationship(
-        "FormTemplate", back_populates="booking_type"
+        "FormTemplate",
+        back_populates="booking_type",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 # app/models/contact.py
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Index
+from sqlalchemy import String, Index, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.core.database import Base
@@ -18,9 +18,23 @@ if TYPE_CHECKING:
 
 class Contact(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteMixin):
     __tablename__ = "contacts"
+    # Fetch created_at/updated_at via INSERT/UPDATE ... RETURNING at flush
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        Index("ix_contacts_workspace_email", "workspace_id", "primary_email"),
-        Index("ix_contacts_workspace_phone", "workspace_id", "primary_phone"),
+        # Every contact match filters on live rows only
+        Index(
+            "ix_contacts_ws_email_live",
+            "workspace_id",
+            "primary_email",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_contacts_ws_phone_live",
+            "workspace_id",
+            "primary_phone",
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
     full_name: Mapped[str] = mapped_column(String(255))
@@ -28,11 +42,19 @@ class Contact(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteM
     primary_phone: Mapped[str | None] = mapped_column(String(50))
     external_id: Mapped[str | None] = mapped_column(String(255))
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="contacts")
-    conversation: Mapped["Conversation"] = relationship(
-        "Conversation", back_populates="contact", uselist=False
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="contacts", lazy="raise_on_sql")
+    # 1:1 (uq_conversations_contact_id): one LEFT JOIN on the unique index is
+    # cheaper than the follow-up SELECT every contact-facing path needed.
+    conversation: Mapped["Conversation | None"] = relationship(
+        "Conversation",
+        back_populates="contact",
+        uselist=False,
+        lazy="joined",
+        innerjoin=False,
     )
     bookings: Mapped[list["Booking"]] = relationship("Booking", back_populates="contact")
     form_submissions: Mapped[list["FormSubmission"]] = relationship(
-        "FormSubmission", back_populates="contact"
+        "FormSubmission",
+        back_populates="contact",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -6,10 +6,11 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, UniqueConstraint, Index, Boolean
+from sqlalchemy import ForeignKey, UniqueConstraint, Index, Boolean, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteMixin
 
 if TYPE_CHECKING:
@@ -38,13 +39,28 @@ class Conversation(
     SoftDeleteMixin,
 ):
     __tablename__ = "conversations"
+    # Fetch created_at/updated_at via INSERT/UPDATE ... RETURNING at flush
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("contact_id", name="uq_conversations_contact_id"),
+        # INCLUDE carries every column the inbox conversation list reads.
         Index(
             "ix_conversations_workspace_status",
             "workspace_id",
             "status",
             "updated_at",
+            postgresql_include=["id", "contact_id", "last_message_at", "is_deleted"],
+        ),
+        # Unanswered-conversation scans (inbox + dashboard) filter
+        # workspace_id, status and automation_paused = false; paused rows
+        # never enter this index.
+        Index(
+            "ix_conv_active_by_ws",
+            "workspace_id",
+            "status",
+            postgresql_include=["id"],
+            postgresql_where=text("automation_paused = false"),
         ),
     )
 
@@ -53,12 +69,12 @@ class Conversation(
         nullable=False,
     )
     status: Mapped[ConversationStatus] = mapped_column(
-        Enum(ConversationStatus, name="conversation_status"),
+        OrdinalEnum(ConversationStatus),
         default=ConversationStatus.open,
         nullable=False,
     )
     channel_preference: Mapped[ChannelPreference] = mapped_column(
-        Enum(ChannelPreference, name="channel_preference"),
+        OrdinalEnum(ChannelPreference),
         default=ChannelPreference.mixed,
         nullable=False,
     )
@@ -72,11 +88,12 @@ class Conversation(
     # relationships unchanged...
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="conversations"
+        "Workspace", back_populates="conversations", lazy="raise_on_sql"
     )
     contact: Mapped["Contact"] = relationship("Contact", back_populates="conversation")
     messages: Mapped[list["Message"]] = relationship(
         "Message",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -1,7 +1,7 @@
 # app/models/event_log.py
 from __future__ import annotations
 
-from sqlalchemy import String, Enum, Index
+from sqlalchemy import String, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
@@ -9,6 +9,7 @@ import enum
 from typing import TYPE_CHECKING
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 # existing imports...
 
 if TYPE_CHECKING:
@@ -38,6 +39,11 @@ class ActorType(str, enum.Enum):
 
 
 class EventLog(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
+    # Not range-partitioned by created_at: a partitioned table's primary key
+    # and any FK target must include the partition key, and both the id-only
+    # PK and automation_runs.event_id -> event_log.id rely on id alone.
+    # Partitioning needs a (id, created_at) key and automation_runs carrying
+    # event_created_at first.
     __tablename__ = "event_log"
     __table_args__ = (
         Index("ix_events_workspace_created", "workspace_id", "created_at"),
@@ -54,6 +60,14 @@ class EventLog(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
             "entity_id",
             "created_at",
         ),
+        # Append-only, so created_at follows physical order: a BRIN summary is
+        # a few KB and serves wide time-window scans across workspaces.
+        Index(
+            "ix_events_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     event_type: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -61,7 +75,7 @@ class EventLog(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     entity_id: Mapped[str | None] = mapped_column(String(255))
 
     actor_type: Mapped[ActorType] = mapped_column(
-        Enum(ActorType, name="event_actor_type"),
+        OrdinalEnum(ActorType),
         nullable=False,
     )
     actor_id: Mapped[str | None] = mapped_column(String(255))
@@ -69,4 +83,4 @@ class EventLog(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
 
     payload: Mapped[dict | None] = mapped_column(JSONB)
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="events")
\ No newline at end of file
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="events", lazy="raise_on_sql")
\ No newline at end of file
@@ -5,7 +5,7 @@ from datetime import datetime
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Index
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -21,6 +21,9 @@ if TYPE_CHECKING:
 
 class FormSubmission(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "form_submissions"
+    # Fetch created_at/updated_at via INSERT/UPDATE ... RETURNING at flush
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         Index(
             "ix_form_submissions_workspace_form",
@@ -28,6 +31,25 @@ class FormSubmission(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
             "form_template_id",
             "created_at",
         ),
+        # Keyset pagination for list_form_submissions (newest first), with and
+        # without the template filter.
+        Index(
+            "ix_form_submissions_ws_template_submitted",
+            "workspace_id",
+            "form_template_id",
+            text("submitted_at DESC"),
+        ),
+        Index(
+            "ix_form_submissions_ws_submitted",
+            "workspace_id",
+            text("submitted_at DESC"),
+        ),
+        # Duplicate-submission check in submit_public_form
+        Index(
+            "ix_form_submissions_template_booking",
+            "form_template_id",
+            "booking_id",
+        ),
     )
 
     form_template_id: Mapped["uuid.UUID"] = mapped_column(
@@ -47,7 +69,7 @@ class FormSubmission(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     answers: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="form_submissions"
+        "Workspace", back_populates="form_submissions", lazy="raise_on_sql"
     )
     form_template: Mapped["FormTemplate"] = relationship(
         "FormTemplate", back_populates="submissions"
@@ -4,7 +4,7 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Boolean, UniqueConstraint, Index, ForeignKey
+from sqlalchemy import String, Boolean, UniqueConstraint, Index, ForeignKey, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -27,10 +27,19 @@ class FormTemplate(
     __tablename__ = "form_templates"
     __table_args__ = (
         UniqueConstraint("workspace_id", "name", name="uq_form_template_name_ws"),
+        # Template list (live rows, by name)
         Index(
-            "ix_form_templates_workspace_active",
+            "ix_form_templates_ws_name_live",
             "workspace_id",
-            "is_deleted",
+            "name",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Template lookup by booking type (pending bookings, public form link)
+        Index(
+            "ix_form_templates_ws_booking_type",
+            "workspace_id",
+            "booking_type_id",
+            postgresql_where=text("is_deleted = false"),
         ),
     )
 
@@ -43,9 +52,11 @@ class FormTemplate(
         ForeignKey("booking_types.id", ondelete="SET NULL"),
         nullable=True,
     )
+    # Field whose answer becomes the inbox message body; derived from schema on save
+    inbox_field_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="form_templates"
+        "Workspace", back_populates="form_templates", lazy="raise_on_sql"
     )
     booking_type: Mapped["BookingType | None"] = relationship(
         "BookingType", back_populates="form_templates", foreign_keys=[booking_type_id]
@@ -3,7 +3,7 @@ from __future__ import annotations
 # app/models/inventory_item.py
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, UniqueConstraint, Index
+from sqlalchemy import String, Integer, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -23,12 +23,25 @@ class InventoryItem(
     SoftDeleteMixin,
 ):
     __tablename__ = "inventory_items"
+    # Fetch created_at/updated_at via INSERT/UPDATE ... RETURNING at flush
+    # instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        UniqueConstraint("workspace_id", "sku", name="uq_inventory_sku_ws"),
+        # Unique among live items only, so a soft-deleted SKU can be reused;
+        # also the ON CONFLICT target for create_inventory_item.
         Index(
-            "ix_inventory_items_workspace_active",
+            "inventory_ws_sku_uq",
             "workspace_id",
-            "is_deleted",
+            "sku",
+            unique=True,
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # list_inventory: live items ordered by name
+        Index(
+            "ix_inventory_ws_name",
+            "workspace_id",
+            "name",
+            postgresql_where=text("is_deleted = false"),
         ),
     )
 
@@ -38,11 +51,13 @@ class InventoryItem(
     current_quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     reorder_threshold: Mapped[int | None] = mapped_column(Integer)
     unit: Mapped[str | None] = mapped_column(String(50))
-    infodata: Mapped[dict | None] = mapped_column(JSONB)
+    infodata: Mapped[dict | None] = mapped_column(JSONB, deferred=True)  # unread; undefer() to load
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="inventory_items"
+        "Workspace", back_populates="inventory_items", lazy="raise_on_sql"
     )
     usage_logs: Mapped[list["InventoryUsageLog"]] = relationship(
-        "InventoryUsageLog", back_populates="item"
+        "InventoryUsageLog",
+        back_populates="item",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -39,7 +39,7 @@ class InventoryUsageLog(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     reason: Mapped[str | None] = mapped_column(String(255))
 
     workspace: Mapped["Workspace"] = relationship(
-        "Workspace", back_populates="inventory_usage_logs"
+        "Workspace", back_populates="inventory_usage_logs", lazy="raise_on_sql"
     )
     item: Mapped["InventoryItem"] = relationship(
         "InventoryItem", back_populates="usage_logs"
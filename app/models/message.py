@@ -1,7 +1,7 @@
 # app/models/message.py
 from __future__ import annotations
 
-from sqlalchemy import Enum, String, ForeignKey, Index
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
 
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin
 
 
@@ -51,11 +52,15 @@ class MessageStatus(str, enum.Enum):
 class Message(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "messages"
     __table_args__ = (
+        # Thread pages (created_at ASC) and the dashboard/inbox "last
+        # inbound/outbound per conversation" aggregates; INCLUDE (direction)
+        # makes the latter index-only.
         Index(
-            "ix_messages_workspace_conversation",
+            "ix_messages_ws_conv_created",
             "workspace_id",
             "conversation_id",
             "created_at",
+            postgresql_include=["direction"],
         ),
         Index("ix_messages_workspace_status", "workspace_id", "status", "created_at"),
     )
@@ -65,11 +70,11 @@ class Message(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
         nullable=False,
     )
     direction: Mapped[MessageDirection] = mapped_column(
-        Enum(MessageDirection, name="message_direction"),
+        OrdinalEnum(MessageDirection),
         nullable=False,
     )
     channel: Mapped[MessageChannel] = mapped_column(
-        Enum(MessageChannel, name="message_channel"),
+        OrdinalEnum(MessageChannel),
         nullable=False,
     )
     subject: Mapped[str | None] = mapped_column(String(255))
@@ -81,14 +86,14 @@ class Message(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     to_phone: Mapped[str | None] = mapped_column(String(50))
     provider_message_id: Mapped[str | None] = mapped_column(String(255))
     status: Mapped[MessageStatus] = mapped_column(
-        Enum(MessageStatus, name="message_status"),
+        OrdinalEnum(MessageStatus),
         default=MessageStatus.queued,
         nullable=False,
     )
     error_code: Mapped[str | None] = mapped_column(String(255))
     infodata: Mapped[dict | None] = mapped_column(JSONB)
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="messages")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="messages", lazy="raise_on_sql")
     conversation: Mapped["Conversation"] = relationship(
-        "Conversation", back_populates="messages"
+        "Conversation", back_populates="messages", lazy="raise_on_sql"
     )
\ No newline at end of file
@@ -2,14 +2,20 @@
 import uuid
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, declared_attr
-from sqlalchemy import func, Boolean, DateTime
+from sqlalchemy import func, text, Boolean, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 
+from app.core.ids import uuid7
+
 class UUIDMixin:
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # ORM code reads obj.id before flush, so the client keeps minting ids;
+        # UUIDv7 keeps pk index inserts on the right-most leaf. The server
+        # default covers raw SQL and Core inserts that omit it.
+        default=uuid7,
+        server_default=text("gen_random_uuid()"),
     )
 
 class TimestampMixin:
@@ -23,9 +29,11 @@ class TimestampMixin:
     )
 
 class WorkspaceScopedMixin:
+    # No index=True: every scoped table already has a composite index (or
+    # unique constraint) leading with workspace_id. A ForeignKey belongs to
+    # exactly one Column, so each class still builds its own.
     @declared_attr
     def workspace_id(cls) -> Mapped[uuid.UUID]:
-        from sqlalchemy import ForeignKey
         return mapped_column(
             UUID(as_uuid=True),
             ForeignKey("workspaces.id", ondelete="CASCADE"),
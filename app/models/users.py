@@ -4,10 +4,11 @@ from __future__ import annotations
 import enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Enum, Boolean, UniqueConstraint, Index
+from sqlalchemy import String, Boolean, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 from .mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDeleteMixin
 
 if TYPE_CHECKING:
@@ -26,30 +27,43 @@ class StaffUser(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin, SoftDelet
     __tablename__ = "staff_users"
     __table_args__ = (
         UniqueConstraint("workspace_id", "email", name="uq_staff_email_per_workspace"),
-        Index("ix_staff_workspace_active", "workspace_id", "is_active"),
+        # Staff list: live rows only (inactive staff are still listed)
+        Index("ix_staff_ws_live", "workspace_id", postgresql_where=text("is_deleted = false")),
+        # Covering index for per-request membership/role checks
+        Index(
+            "ix_staff_users_ws_email_active",
+            "workspace_id",
+            "email",
+            "is_deleted",
+            postgresql_include=["role", "id"],
+        ),
     )
 
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255))
     role: Mapped[StaffRole] = mapped_column(
-        Enum(StaffRole, name="staff_role"),
+        OrdinalEnum(StaffRole),
         default=StaffRole.staff,
         nullable=False,
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="staff_users")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="staff_users", lazy="raise_on_sql")
     bookings: Mapped[list["Booking"]] = relationship(
         "Booking",
         back_populates="assigned_staff",
         foreign_keys="Booking.assigned_staff_id",
+        passive_deletes=True,
     )
     availability_slots: Mapped[list["AvailabilitySlot"]] = relationship(
-        "AvailabilitySlot", back_populates="staff_user"
+        "AvailabilitySlot",
+        back_populates="staff_user",
+        passive_deletes=True,
     )
     acknowledged_alerts: Mapped[list["Alert"]] = relationship(
         "Alert",
         back_populates="acknowledged_by",
         foreign_keys="Alert.acknowledged_by_id",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -5,10 +5,11 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Enum, Index
+from sqlalchemy import String, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 from .mixins import UUIDMixin, TimestampMixin
 
 if TYPE_CHECKING:
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from .booking_type import BookingType
     from .booking import Booking
     from .availability_slot import AvailabilitySlot
+    from .availability import AvailabilityRule, BlockedSlot
     from .form_template import FormTemplate
     from .form_submission import FormSubmission
     from .inventory_item import InventoryItem
@@ -48,55 +50,110 @@ class Workspace(Base, UUIDMixin, TimestampMixin):
         back_populates="workspace",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[WorkspaceStatus] = mapped_column(
-        Enum(WorkspaceStatus, name="workspace_status"),
+        OrdinalEnum(WorkspaceStatus),
         default=WorkspaceStatus.draft,
         nullable=False,
     )
     owner_id: Mapped["uuid.UUID | None"] = mapped_column(nullable=True)
 
     staff_users: Mapped[list["StaffUser"]] = relationship(
-        "StaffUser", back_populates="workspace", cascade="all, delete-orphan"
+        "StaffUser",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     contacts: Mapped[list["Contact"]] = relationship(
-        "Contact", back_populates="workspace", cascade="all, delete-orphan"
+        "Contact",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     conversations: Mapped[list["Conversation"]] = relationship(
-        "Conversation", back_populates="workspace", cascade="all, delete-orphan"
+        "Conversation",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     messages: Mapped[list["Message"]] = relationship(
-        "Message", back_populates="workspace", cascade="all, delete-orphan"
+        "Message",
+        back_populates="workspace",
+        cascade="all",
+        passive_deletes=True,
     )
     booking_types: Mapped[list["BookingType"]] = relationship(
-        "BookingType", back_populates="workspace", cascade="all, delete-orphan"
+        "BookingType",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     bookings: Mapped[list["Booking"]] = relationship(
-        "Booking", back_populates="workspace", cascade="all, delete-orphan"
+        "Booking",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     availability_slots: Mapped[list["AvailabilitySlot"]] = relationship(
-        "AvailabilitySlot", back_populates="workspace", cascade="all, delete-orphan"
+        "AvailabilitySlot",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     form_templates: Mapped[list["FormTemplate"]] = relationship(
-        "FormTemplate", back_populates="workspace", cascade="all, delete-orphan"
+        "FormTemplate",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     form_submissions: Mapped[list["FormSubmission"]] = relationship(
-        "FormSubmission", back_populates="workspace", cascade="all, delete-orphan"
+        "FormSubmission",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     inventory_items: Mapped[list["InventoryItem"]] = relationship(
-        "InventoryItem", back_populates="workspace", cascade="all, delete-orphan"
+        "InventoryItem",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     inventory_usage_logs: Mapped[list["InventoryUsageLog"]] = relationship(
-        "InventoryUsageLog", back_populates="workspace", cascade="all, delete-orphan"
+        "InventoryUsageLog",
+        back_populates="workspace",
+        cascade="all",
+        passive_deletes=True,
     )
     alerts: Mapped[list["Alert"]] = relationship(
-        "Alert", back_populates="workspace", cascade="all, delete-orphan"
+        "Alert",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     events: Mapped[list["EventLog"]] = relationship(
-        "EventLog", back_populates="workspace", cascade="all, delete-orphan"
+        "EventLog",
+        back_populates="workspace",
+        cascade="all",
+        passive_deletes=True,
     )
     automation_rules: Mapped[list["AutomationRule"]] = relationship(
-        "AutomationRule", back_populates="workspace", cascade="all, delete-orphan"
+        "AutomationRule",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    availability_rules: Mapped[list["AvailabilityRule"]] = relationship(
+        "AvailabilityRule",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    blocked_slots: Mapped[list["BlockedSlot"]] = relationship(
+        "BlockedSlot",
+        back_populates="workspace",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
\ No newline at end of file
@@ -1,7 +1,7 @@
 # app/models/workspace_email_config.py
 from __future__ import annotations
 
-from sqlalchemy import String, Boolean, UniqueConstraint, Index, Enum
+from sqlalchemy import String, Boolean, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -11,6 +11,7 @@ from app.models.mixins import UUIDMixin, TimestampMixin, WorkspaceScopedMixin
 from typing import TYPE_CHECKING
 
 from app.core.database import Base
+from app.core.types import OrdinalEnum
 # existing imports...
 
 if TYPE_CHECKING:
@@ -26,12 +27,12 @@ class EmailProvider(str, enum.Enum):
 class WorkspaceEmailConfig(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin):
     __tablename__ = "workspace_email_configs"
     __table_args__ = (
+        # One row per workspace: the unique index serves every lookup
         UniqueConstraint("workspace_id", name="uq_workspace_email_config_per_ws"),
-        Index("ix_workspace_email_config_workspace_active", "workspace_id", "is_active"),
     )
 
     provider: Mapped[EmailProvider] = mapped_column(
-        Enum(EmailProvider, name="email_provider"),
+        OrdinalEnum(EmailProvider),
         nullable=False,
     )
     from_email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -41,4 +42,4 @@ class WorkspaceEmailConfig(Base, UUIDMixin, TimestampMixin, WorkspaceScopedMixin
     )  # e.g. "default-resend" (actual key in env/secret store)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="email_config")
\ No newline at end of file
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="email_config", lazy="raise_on_sql")
\ No newline at end of file
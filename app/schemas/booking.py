@@ -1,28 +1,13 @@
 # app/schemas/booking.py
-from datetime import datetime, date, timezone
-from typing import List, Optional
+from datetime import datetime, date
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, ConfigDict, field_validator
 
 from app.models.booking import BookingStatus
 from app.models.message import MessageChannel
 from app.models.booking_type import BookingType
-
-
-# ---------- Helpers ----------
-
-def _ensure_utc(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
-
-
-def _parse_datetime(v: datetime | str) -> datetime:
-    if isinstance(v, str):
-        dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
-    else:
-        dt = v
-    return _ensure_utc(dt)
+from app.schemas.utils import UtcDatetime, empty_to_none
 
 
 # ---------- Input DTOs ----------
@@ -30,23 +15,11 @@ def _parse_datetime(v: datetime | str) -> datetime:
 class PublicBookingCreateRequest(BaseModel):
     booking_type_slug: str
     # Exact slot start/end (as returned from availability API)
-    start_at: datetime
-    end_at: datetime
+    start_at: UtcDatetime
+    end_at: UtcDatetime
     full_name: str = Field(..., max_length=255)
-    email: Optional[EmailStr] = None
-    phone: Optional[str] = Field(default=None, max_length=50)
-
-    @field_validator("start_at", "end_at", mode="before")
-    @classmethod
-    def ensure_utc(cls, v: datetime | str) -> datetime:
-        return _parse_datetime(v)
-
-    @field_validator("email", "phone", mode="before")
-    @classmethod
-    def empty_to_none(cls, v):
-        if v is not None and isinstance(v, str) and not v.strip():
-            return None
-        return v
+    email: Annotated[Optional[EmailStr], BeforeValidator(empty_to_none)] = None
+    phone: Annotated[Optional[str], BeforeValidator(empty_to_none)] = Field(default=None, max_length=50)
 
     @field_validator("phone")
     @classmethod
@@ -1,5 +1,5 @@
 # app/schemas/inventory.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
@@ -39,6 +39,12 @@ class InventoryOut(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def _id_to_str(cls, v):
+        # ORM rows carry uuid.UUID ids
+        return v if isinstance(v, str) else str(v)
+
 class InventoryLowStockItem(BaseModel):
     """Schema for low stock inventory items in dashboard."""
     id: str
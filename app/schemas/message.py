@@ -6,12 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 from app.models.message import MessageChannel, MessageDirection, MessageStatus
-
-
-def _ensure_utc(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+from app.schemas.utils import ensure_utc
 
 
 class StaffSendMessageRequest(BaseModel):
@@ -46,7 +41,7 @@ class InboundMessageWebhook(BaseModel):
     received_at: Optional[datetime] = None
 
     def normalized_received_at(self) -> datetime:
-        return _ensure_utc(self.received_at or datetime.now(timezone.utc))
+        return ensure_utc(self.received_at or datetime.now(timezone.utc))
 
 
 class MessageOut(BaseModel):
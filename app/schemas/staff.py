@@ -1,5 +1,5 @@
 # app/schemas/staff.py
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
 from datetime import datetime
 from app.models.users import StaffRole
@@ -31,3 +31,9 @@ class StaffOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _id_to_str(cls, v):
+        # ORM rows carry uuid.UUID ids
+        return v if isinstance(v, str) else str(v)
@@ -0,0 +1,70 @@
+# app/schemas/utils.py
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Annotated, Any, TypeVar
+from uuid import UUID
+
+from pydantic import AfterValidator, BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _attribute_map(cls: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    # (field name, ORM attribute name); aliased fields like `schema_` read `schema`.
+    return tuple((name, field.alias or name) for name, field in cls.model_fields.items())
+
+
+def orm_to_out(cls: type[ModelT], obj: Any) -> ModelT:
+    """
+    Build an output schema from a trusted ORM row without running validation.
+
+    Only for data that came straight from our own tables.
+    """
+    values = {name: getattr(obj, attr) for name, attr in _attribute_map(cls)}
+    return cls.model_construct(_fields_set=set(values), **values)
+
+
+def ensure_utc(dt: datetime) -> datetime:
+    """Naive datetimes are taken as UTC; aware ones are converted to UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+# pydantic-core parses the value (ISO strings, "Z" suffix included); only the
+# UTC normalisation runs in Python. Naive inputs stay accepted: availability
+# slots are returned without an offset and posted back as-is.
+UtcDatetime = Annotated[datetime, AfterValidator(ensure_utc)]
+
+
+def empty_to_none(v: Any) -> Any:
+    """Blank form fields ("", "  ") count as not provided."""
+    if isinstance(v, str) and not v.strip():
+        return None
+    return v
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_cursor(ts: datetime, row_id: UUID) -> str:
+    """
+    Keyset cursor for a (timestamp, id) sort key: "<epoch microseconds>_<hex id>".
+
+    Only URL-safe characters, so clients can pass it back unencoded.
+    """
+    return f"{(ensure_utc(ts) - _EPOCH) // _MICROSECOND}_{row_id.hex}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Inverse of `encode_cursor`; raises ValueError on malformed input.
+
+    The timestamp comes back naive UTC to match our `timestamp without time
+    zone` columns; an aware bind would make Postgres convert the column via
+    the session TimeZone.
+    """
+    micros, _, hex_id = cursor.partition("_")
+    return (_EPOCH + int(micros) * _MICROSECOND).replace(tzinfo=None), UUID(hex=hex_id)
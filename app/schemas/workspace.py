@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+from pydantic import AliasPath, BaseModel, EmailStr, Field, ConfigDict, field_validator
 
 from app.models.workspace import WorkspaceStatus
 from app.models.users import StaffRole
@@ -104,14 +104,17 @@ class WorkspaceEmailConfigUpdate(BaseModel):
 # ---------- Availability slots (Owner management) ----------
 
 class AvailabilitySlotOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    # Validates from an AvailabilitySlot with booking_type and staff_user
+    # loaded (the aliases read through the relationships), or by field name
+    # from a flat row with matching labels.
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
     id: str
-    booking_type_slug: str
-    booking_type_name: str
+    booking_type_slug: str = Field(validation_alias=AliasPath("booking_type", "slug"))
+    booking_type_name: str = Field(validation_alias=AliasPath("booking_type", "name"))
     start_at: datetime
     end_at: datetime
-    staff_name: Optional[str] = None
+    staff_name: Optional[str] = Field(default=None, validation_alias=AliasPath("staff_user", "full_name"))
 
     @field_validator("id", mode="before")
     @classmethod
@@ -6,6 +6,7 @@ from typing import List, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func, and_, or_
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.models.booking import Booking, BookingStatus
@@ -25,6 +26,7 @@ from app.schemas.analytics import (
     DashboardOverview,
     AiOperationalSummary,
 )
+from app.schemas.utils import orm_to_out
 from app.services.ai_service import AIService
 
 
@@ -32,6 +34,30 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Flat column projection for dashboard booking cards: labels match
+# BookingCard's fields, rows go through orm_to_out (no ORM hydration, no
+# per-row validation).
+_BOOKING_CARDS_SELECT = (
+    select(
+        Booking.id,
+        Booking.start_at,
+        Booking.end_at,
+        Booking.status,
+        Contact.full_name.label("contact_name"),
+        BookingType.name.label("booking_type_name"),
+        Contact.id.label("contact_id"),
+        Contact.primary_email,
+        Contact.primary_phone,
+    )
+    .join(Contact, Booking.contact_id == Contact.id)
+    .join(BookingType, Booking.booking_type_id == BookingType.id)
+)
+
+
+def _booking_cards(rows) -> list[BookingCard]:
+    return [orm_to_out(BookingCard, row) for row in rows]
+
+
 class DashboardAnalyticsService:
     """
     Aggregated analytics for the workspace dashboard.
@@ -85,19 +111,14 @@ class DashboardAnalyticsService:
             active_alerts=active_alerts,
         )
 
-    async def get_ai_operational_summary(
+    def _collect_ai_metrics(
         self,
         workspace_id: UUID,
-        *,
-        unanswered_min_age_minutes: int = 30,
-        upcoming_days: int = 7,
-        forms_overdue_hours: int = 24,
-    ) -> AiOperationalSummary:
-        """
-        Computes base metrics and calls AIService.analyze_operational_risk().
-        Fails safely; always returns a structured response.
-        """
-
+        unanswered_min_age_minutes: int,
+        upcoming_days: int,
+        forms_overdue_hours: int,
+    ) -> tuple:
+        """Sync DB part of get_ai_operational_summary."""
         today_start, today_end = self._today_bounds()
         now = _utc_now()
         upcoming_end = now + timedelta(days=upcoming_days)
@@ -139,6 +160,50 @@ class DashboardAnalyticsService:
             "no_show": no_show,
         }
 
+        return (
+            unanswered,
+            completed,
+            no_show,
+            no_show_rate,
+            form_stats,
+            low_stock_items,
+            today_bookings_count,
+            upcoming_bookings_count,
+            booking_trends,
+        )
+
+    async def get_ai_operational_summary(
+        self,
+        workspace_id: UUID,
+        *,
+        unanswered_min_age_minutes: int = 30,
+        upcoming_days: int = 7,
+        forms_overdue_hours: int = 24,
+    ) -> AiOperationalSummary:
+        """
+        Computes base metrics and calls AIService.analyze_operational_risk().
+        Fails safely; always returns a structured response.
+        """
+        # The metric queries use the sync Session; run them in the worker
+        # threadpool so they don't block the event loop, then await the AI call.
+        (
+            unanswered,
+            completed,
+            no_show,
+            no_show_rate,
+            form_stats,
+            low_stock_items,
+            today_bookings_count,
+            upcoming_bookings_count,
+            booking_trends,
+        ) = await run_in_threadpool(
+            self._collect_ai_metrics,
+            workspace_id,
+            unanswered_min_age_minutes,
+            upcoming_days,
+            forms_overdue_hours,
+        )
+
         # ---------------------------------------------------
         # EARLY EXIT — Not enough data for AI
         # ---------------------------------------------------
@@ -232,11 +297,8 @@ class DashboardAnalyticsService:
         upcoming_end: datetime,
         limit_per_list: int = 20,
     ) -> tuple[list[BookingCard], list[BookingCard]]:
-        # Today
         today_stmt = (
-            select(Booking, Contact, BookingType)
-            .join(Contact, Booking.contact_id == Contact.id)
-            .join(BookingType, Booking.booking_type_id == BookingType.id)
+            _BOOKING_CARDS_SELECT
             .where(
                 Booking.workspace_id == workspace_id,
                 Booking.start_at >= today_start,
@@ -246,26 +308,11 @@ class DashboardAnalyticsService:
             .limit(limit_per_list)
         )
         today_rows = self.db.execute(today_stmt).all()
-        today_bookings = [
-            BookingCard(
-                id=b.id,
-                start_at=b.start_at,
-                end_at=b.end_at,
-                status=b.status,
-                contact_name=c.full_name,
-                booking_type_name=bt.name,
-                contact_id=c.id,
-                primary_email=c.primary_email,
-                primary_phone=c.primary_phone,
-            )
-            for b, c, bt in today_rows
-        ]
+        today_bookings = _booking_cards(today_rows)
 
         # Upcoming (after now)
         upcoming_stmt = (
-            select(Booking, Contact, BookingType)
-            .join(Contact, Booking.contact_id == Contact.id)
-            .join(BookingType, Booking.booking_type_id == BookingType.id)
+            _BOOKING_CARDS_SELECT
             .where(
                 Booking.workspace_id == workspace_id,
                 Booking.start_at >= now,
@@ -278,20 +325,7 @@ class DashboardAnalyticsService:
             .limit(limit_per_list)
         )
         upcoming_rows = self.db.execute(upcoming_stmt).all()
-        upcoming_bookings = [
-            BookingCard(
-                id=b.id,
-                start_at=b.start_at,
-                end_at=b.end_at,
-                status=b.status,
-                contact_name=c.full_name,
-                booking_type_name=bt.name,
-                contact_id=c.id,
-                primary_email=c.primary_email,
-                primary_phone=c.primary_phone,
-            )
-            for b, c, bt in upcoming_rows
-        ]
+        upcoming_bookings = _booking_cards(upcoming_rows)
 
         return today_bookings, upcoming_bookings
 
@@ -306,9 +340,7 @@ class DashboardAnalyticsService:
         now = _utc_now()
         history_start = now - timedelta(days=history_days)
         stmt = (
-            select(Booking, Contact, BookingType)
-            .join(Contact, Booking.contact_id == Contact.id)
-            .join(BookingType, Booking.booking_type_id == BookingType.id)
+            _BOOKING_CARDS_SELECT
             .where(
                 Booking.workspace_id == workspace_id,
                 Booking.start_at >= history_start,
@@ -320,20 +352,7 @@ class DashboardAnalyticsService:
             .limit(limit)
         )
         rows = self.db.execute(stmt).all()
-        return [
-            BookingCard(
-                id=b.id,
-                start_at=b.start_at,
-                end_at=b.end_at,
-                status=b.status,
-                contact_name=c.full_name,
-                booking_type_name=bt.name,
-                contact_id=c.id,
-                primary_email=c.primary_email,
-                primary_phone=c.primary_phone,
-            )
-            for b, c, bt in rows
-        ]
+        return _booking_cards(rows)
 
     def _get_booking_trend_counts(
         self,
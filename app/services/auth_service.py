@@ -0,0 +1,59 @@
+# app/services/auth_service.py
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.models.users import StaffRole, StaffUser
+
+
+class StaffLogin(NamedTuple):
+    """Plain snapshot of the StaffUser columns login needs (never an ORM instance)."""
+
+    id: UUID
+    email: str
+    hashed_password: str
+    role: StaffRole
+    workspace_id: UUID
+    is_active: bool
+
+
+# Login lookups keyed by email. Only hits are cached; every write that
+# touches these columns must call `invalidate_staff_login`.
+_login_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_login_cache_lock = threading.Lock()
+
+_STAFF_LOGIN_STMT = select(
+    StaffUser.id,
+    StaffUser.email,
+    StaffUser.hashed_password,
+    StaffUser.role,
+    StaffUser.workspace_id,
+    StaffUser.is_active,
+).where(StaffUser.email == bindparam("email")).limit(1)
+
+
+def get_staff_login(db: Session, email: str) -> StaffLogin | None:
+    """Return the login record for `email`, served from cache when possible."""
+    with _login_cache_lock:
+        cached = _login_cache.get(email)
+    if cached is not None:
+        return cached
+    row = db.execute(_STAFF_LOGIN_STMT, {"email": email}).first()
+    if row is None:
+        return None
+    record = StaffLogin(*row)
+    with _login_cache_lock:
+        _login_cache[email] = record
+    return record
+
+
+def invalidate_staff_login(email: str) -> None:
+    """Drop the cached login record after a password/role/status change."""
+    with _login_cache_lock:
+        _login_cache.pop(email, None)
@@ -0,0 +1,58 @@
+# app/services/automation_compiler.py
+"""
+Compiled AutomationRule conditions.
+
+A rule's `conditions` JSON is turned into a predicate once and reused for
+every event it is matched against. Entries are keyed by
+``(rule.id, rule.updated_at)``; edits bump `updated_at`, so a changed rule
+simply misses and compiles afresh while the stale entry ages out.
+"""
+import threading
+from typing import Callable
+
+from cachetools import TTLCache
+
+from app.models.automation_rule import AutomationRule
+from app.models.event_log import EventLog
+
+Predicate = Callable[[EventLog], bool]
+
+_compiled_conditions: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_compiled_conditions_lock = threading.Lock()
+
+
+def _always(event: EventLog) -> bool:
+    return True
+
+
+def _compile(conditions: dict) -> Predicate:
+    """
+    Minimal, explicit filter:
+    - payload_equals: dict of key->value equals checks on event.payload
+    - actor_type_in: list of allowed actor types
+    """
+    payload_equals = tuple((conditions.get("payload_equals") or {}).items())
+    actor_type_in = tuple(conditions.get("actor_type_in") or ())
+    if not payload_equals and not actor_type_in:
+        return _always
+
+    def predicate(event: EventLog) -> bool:
+        payload = event.payload or {}
+        for key, expected in payload_equals:
+            if payload.get(key) != expected:
+                return False
+        return not actor_type_in or event.actor_type.value in actor_type_in
+
+    return predicate
+
+
+def conditions_predicate(rule: AutomationRule) -> Predicate:
+    """Cached predicate for `rule.conditions`."""
+    key = (rule.id, rule.updated_at)
+    with _compiled_conditions_lock:
+        predicate = _compiled_conditions.get(key)
+    if predicate is None:
+        predicate = _compile(rule.conditions or {})
+        with _compiled_conditions_lock:
+            _compiled_conditions[key] = predicate
+    return predicate
@@ -5,14 +5,15 @@ from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import BackgroundTasks
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.ids import uuid7
 from app.models.automation_rule import AutomationRule
 from app.models.automation_run import AutomationRun, AutomationRunStatus
 from app.models.event_log import EventLog, ActorType
 from app.models.contact import Contact
-from app.models.conversation import Conversation, ConversationStatus, ChannelPreference
+from app.models.conversation import Conversation
 from app.models.booking import Booking
 from app.models.form_template import FormTemplate
 from app.models.alert import Alert, AlertSeverity, AlertSource
@@ -22,7 +23,28 @@ from app.models.message import (
     MessageDirection,
     MessageStatus,
 )
+from app.services.automation_compiler import conditions_predicate
 from app.services.communication_service import CommunicationService
+from app.services.conversations import get_or_open_conversation
+
+
+# Built once per process; see _get_booking_from_event.
+_BOOKING_WITH_CONTACT_STMT = (
+    select(Booking)
+    .where(Booking.id == bindparam("booking_id"))
+    .options(joinedload(Booking.contact))
+)
+
+# Staff-reply pause: one UPDATE ... RETURNING instead of loading the row.
+_PAUSE_CONVERSATION_STMT = (
+    update(Conversation)
+    .where(Conversation.id == bindparam("conversation_id"))
+    .values(
+        automation_paused=True,
+        last_staff_reply_at=bindparam("replied_at"),
+    )
+    .returning(Conversation.workspace_id)
+)
 
 
 class AutomationService:
@@ -49,21 +71,26 @@ class AutomationService:
         if not rules:
             return
 
-        for rule in rules:
-            run = AutomationRun(
-                workspace_id=event.workspace_id,
-                rule_id=rule.id,
-                event_id=event.id,
-                status=AutomationRunStatus.pending,
-            )
-            self.db.add(run)
-            self.db.flush()
-
+        # All runs for the event in one multi-row INSERT; ids are generated
+        # here, so no RETURNING round trip is needed to dispatch them.
+        run_rows = [
+            {
+                "id": uuid7(),
+                "workspace_id": event.workspace_id,
+                "rule_id": rule.id,
+                "event_id": event.id,
+                "status": AutomationRunStatus.pending,
+            }
+            for rule in rules
+        ]
+        self.db.execute(insert(AutomationRun), run_rows)
+
+        for row in run_rows:
             if background_tasks:
-                background_tasks.add_task(self.execute_run, run.id)
+                background_tasks.add_task(self.execute_run, row["id"])
             else:
                 # synchronous (mainly for tests / simple flows)
-                self.execute_run(run.id)
+                self.execute_run(row["id"])
 
     # ---------- EXECUTION ----------
 
@@ -80,7 +107,7 @@ class AutomationService:
 
         try:
             # Optional: conditions filter on event.payload, entity, actor
-            if not self._conditions_match(rule.conditions or {}, event):
+            if not conditions_predicate(rule)(event):
                 run.status = AutomationRunStatus.skipped
                 self.db.flush()
                 return
@@ -122,25 +149,6 @@ class AutomationService:
             )
         ).all()
 
-    def _conditions_match(self, conditions: dict, event: EventLog) -> bool:
-        """
-        Minimal, explicit filter:
-        - payload_equals: dict of key->value equals checks on event.payload
-        - actor_type_in: list of allowed actor types
-        """
-        payload = event.payload or {}
-
-        payload_equals = conditions.get("payload_equals") or {}
-        for key, expected in payload_equals.items():
-            if payload.get(key) != expected:
-                return False
-
-        actor_type_in = conditions.get("actor_type_in")
-        if actor_type_in and event.actor_type.value not in actor_type_in:
-            return False
-
-        return True
-
     # ---------- Action execution ----------
 
     def _execute_action(self, action: dict, event: EventLog) -> dict:
@@ -355,21 +363,22 @@ class AutomationService:
         if not conv_id:
             return {"status": "skipped", "reason": "missing_conversation_id"}
 
-        conv = self.db.get(Conversation, UUID(conv_id))
-        if not conv:
+        conv_id = UUID(conv_id)
+        workspace_id = self.db.scalar(
+            _PAUSE_CONVERSATION_STMT,
+            {"conversation_id": conv_id, "replied_at": event.created_at},
+        )
+        if workspace_id is None:
             return {"status": "skipped", "reason": "conversation_not_found"}
 
-        conv.automation_paused = True
-        conv.last_staff_reply_at = event.created_at
-
         # Log explicit automation pause event
         self._log_automation_event(
-            conv.workspace_id,
+            workspace_id,
             "automation.paused",
             entity_type="conversation",
-            entity_id=str(conv.id),
+            entity_id=str(conv_id),
         )
-        return {"status": "paused", "conversation_id": str(conv.id)}
+        return {"status": "paused", "conversation_id": str(conv_id)}
 
     # ---------- Entity helpers ----------
 
@@ -384,39 +393,22 @@ class AutomationService:
 
     def _get_booking_from_event(self, event: EventLog) -> Booking:
         if event.entity_type == "booking":
-            return self.db.get(Booking, UUID(event.entity_id))
-        payload = event.payload or {}
-        booking_id = payload.get("booking_id")
-        if not booking_id:
-            raise ValueError("booking_id missing in event for automation rule.")
-        return self.db.get(Booking, UUID(booking_id))
+            booking_id = event.entity_id
+        else:
+            booking_id = (event.payload or {}).get("booking_id")
+            if not booking_id:
+                raise ValueError("booking_id missing in event for automation rule.")
+        # Booking.contact raises on lazy load and the booking actions all need
+        # it. A SELECT rather than db.get(): get() skips loader options when
+        # the booking is already in the identity map.
+        return self.db.scalar(
+            _BOOKING_WITH_CONTACT_STMT, {"booking_id": UUID(booking_id)}
+        )
 
     def _get_or_create_conversation(
         self, workspace_id: UUID, contact: Contact
     ) -> Conversation:
-        conv = self.db.scalar(
-            select(Conversation).where(
-                Conversation.workspace_id == workspace_id,
-                Conversation.contact_id == contact.id,
-                Conversation.is_deleted.is_(False),
-            )
-        )
-        if conv:
-            return conv
-
-        preferred = ChannelPreference.mixed
-        if contact.primary_email and not contact.primary_phone:
-            preferred = ChannelPreference.email
-        elif contact.primary_phone and not contact.primary_email:
-            preferred = ChannelPreference.sms
-
-        conv = Conversation(
-            workspace_id=workspace_id,
-            contact_id=contact.id,
-            status=ConversationStatus.open,
-            channel_preference=preferred,
-        )
-        self.db.add(conv)
+        conv, _ = get_or_open_conversation(self.db, workspace_id, contact)
         return conv
 
     # ---------- Automation event logging ----------
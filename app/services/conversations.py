@@ -0,0 +1,41 @@
+# app/services/conversations.py
+"""
+Conversation lookup shared by the contact-facing services.
+"""
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.ids import uuid7
+from app.models.contact import Contact
+from app.models.conversation import ChannelPreference, Conversation, ConversationStatus
+
+
+def get_or_open_conversation(
+    db: Session, workspace_id: UUID, contact: Contact
+) -> tuple[Conversation, bool]:
+    """
+    The contact's live conversation, or a new open one added to the session.
+
+    The flag is True for a new conversation, so the caller can log
+    `conversation.opened` with its own actor.
+    """
+    conv = contact.conversation
+    if conv is not None and not conv.is_deleted:
+        return conv, False
+
+    preferred = ChannelPreference.mixed
+    if contact.primary_email and not contact.primary_phone:
+        preferred = ChannelPreference.email
+    elif contact.primary_phone and not contact.primary_email:
+        preferred = ChannelPreference.sms
+
+    conv = Conversation(
+        id=uuid7(),  # known up front for the caller's event log
+        workspace_id=workspace_id,
+        contact_id=contact.id,
+        status=ConversationStatus.open,
+        channel_preference=preferred,
+    )
+    db.add(conv)
+    return conv, True
@@ -13,7 +13,6 @@ from app.models.contact import Contact
 from app.models.conversation import (
     Conversation,
     ConversationStatus,
-    ChannelPreference,
 )
 from app.models.message import (
     Message,
@@ -29,6 +28,7 @@ from app.schemas.message import (
 )
 from app.core.database import SessionLocal
 from app.services.communication_service import CommunicationService
+from app.services.conversations import get_or_open_conversation
 
 
 def _utc_now() -> datetime:
@@ -351,30 +351,10 @@ class InboxService:
     def _get_or_create_conversation(
         self, workspace_id: UUID, contact: Contact
     ) -> Conversation:
-        conv = self.db.scalar(
-            select(Conversation).where(
-                Conversation.workspace_id == workspace_id,
-                Conversation.contact_id == contact.id,
-                Conversation.is_deleted.is_(False),
-            )
-        )
-        if conv:
+        conv, created = get_or_open_conversation(self.db, workspace_id, contact)
+        if not created:
             return conv
 
-        preferred = ChannelPreference.mixed
-        if contact.primary_email and not contact.primary_phone:
-            preferred = ChannelPreference.email
-        elif contact.primary_phone and not contact.primary_email:
-            preferred = ChannelPreference.sms
-
-        conv = Conversation(
-            workspace_id=workspace_id,
-            contact_id=contact.id,
-            status=ConversationStatus.open,
-            channel_preference=preferred,
-        )
-        self.db.add(conv)
-
         self._log_event(
             workspace_id=workspace_id,
             event_type="conversation.opened",
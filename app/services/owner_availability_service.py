@@ -2,9 +2,9 @@ from datetime import date, datetime, time, timedelta
 from uuid import UUID
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
-from app.models.availability import AvailabilityRule, BlockedSlot # You'll create these models
+from app.models.availability import AvailabilityRule, BlockedSlot
 from app.schemas.owner_availability import (
     AvailabilityRuleCreate,
     AvailabilityRuleUpdate,
@@ -26,7 +26,7 @@ class OwnerAvailabilityService:
         return db_rule
 
     def list_availability_rules(self, workspace_id: UUID) -> List[AvailabilityRule]:
-        return self.db.query(AvailabilityRule).filter(AvailabilityRule.workspace_id == workspace_id).all()
+        return self.db.query(AvailabilityRule).options(raiseload("*")).filter(AvailabilityRule.workspace_id == workspace_id).all()
 
     def update_availability_rule(self, workspace_id: UUID, rule_id: UUID, rule_update: AvailabilityRuleUpdate) -> Optional[AvailabilityRule]:
         db_rule = self.db.query(AvailabilityRule).filter(
@@ -59,7 +59,7 @@ class OwnerAvailabilityService:
         return db_slot
 
     def list_blocked_slots(self, workspace_id: UUID, from_date: date, to_date: date) -> List[BlockedSlot]:
-        return self.db.query(BlockedSlot).filter(
+        return self.db.query(BlockedSlot).options(raiseload("*")).filter(
             BlockedSlot.workspace_id == workspace_id,
             BlockedSlot.start_datetime <= datetime.combine(to_date, time.max),
             BlockedSlot.end_datetime >= datetime.combine(from_date, time.min),
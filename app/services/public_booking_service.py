@@ -1,22 +1,26 @@
 # app/services/public_booking_service.py
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, date, timezone, timedelta
+from itertools import accumulate
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status, BackgroundTasks
 from psycopg2.extras import DateTimeTZRange
-from sqlalchemy import select, or_, func
+from sqlalchemy import bindparam, select, exists, or_, func, text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload
 
+from app.core.public_cache import invalidate_public_cache
+from app.core.types import enum_ordinal
 from app.models.workspace import Workspace, WorkspaceStatus
 from app.models.booking_type import BookingType
 from app.models.availability_slot import AvailabilitySlot
 from app.models.booking import Booking, BookingStatus, BookingSource
 from app.models.contact import Contact
-from app.models.conversation import Conversation, ConversationStatus, ChannelPreference
+from app.models.conversation import Conversation
 from app.models.message import Message, MessageChannel, MessageDirection, MessageStatus
 from app.models.event_log import EventLog, ActorType
 from app.models.form_template import FormTemplate
@@ -27,6 +31,7 @@ from app.schemas.booking import (
     PublicBookingOut,
     PublicBookingResponse,
 )
+from app.services.conversations import get_or_open_conversation
 
 # if/when you implement Resend integration:
 #from app.integrations.email_resend import send_booking_confirmation_email
@@ -43,6 +48,79 @@ def _truncate_to_seconds(dt: datetime) -> datetime:
     return dt.replace(microsecond=0)
 
 
+# Same rules as get_availability_for_date, evaluated for every day at once:
+# a day qualifies when one of its slots (which must fit inside the day) has
+# a 1-hour chunk, or trailing partial chunk, that no non-cancelled booking
+# for the same staff member overlaps. Unassigned slots are blocked by any
+# booking of the type.
+_AVAILABLE_DATES_SQL = text(
+    """
+    WITH days AS (
+        SELECT generate_series(CAST(:from_date AS date), CAST(:to_date AS date), interval '1 day')::date AS d
+    )
+    SELECT days.d
+    FROM days
+    WHERE EXISTS (
+        SELECT 1
+        FROM availability_slots s
+        CROSS JOIN LATERAL generate_series(s.start_at, s.end_at, interval '1 hour') AS c(chunk_start)
+        WHERE s.workspace_id = :workspace_id
+          AND s.booking_type_id = :booking_type_id
+          AND s.start_at >= days.d
+          AND s.end_at <= days.d + 1
+          AND c.chunk_start < s.end_at
+          AND NOT EXISTS (
+              SELECT 1
+              FROM bookings b
+              WHERE b.workspace_id = :workspace_id
+                AND b.booking_type_id = :booking_type_id
+                AND b.status <> :cancelled_status
+                AND b.start_at < LEAST(c.chunk_start + interval '1 hour', s.end_at)
+                AND b.end_at > c.chunk_start
+                AND (s.staff_user_id IS NULL OR b.assigned_staff_id = s.staff_user_id)
+          )
+    )
+    ORDER BY days.d
+    """
+)
+
+# Serializes booking attempts per (workspace, booking type) until the
+# transaction ends, so the overlap check below and the INSERT can't interleave
+# with a concurrent request. The check is type-wide (any overlapping booking
+# of the type conflicts), hence the key has no time component.
+_BOOKING_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtextextended(:lock_key, 0))")
+
+# Built once per process; every public availability/booking request runs both.
+_ACTIVE_WORKSPACE_STMT = select(Workspace).where(
+    Workspace.id == bindparam("workspace_id"),
+    Workspace.status == WorkspaceStatus.active,
+)
+_BOOKING_TYPE_BY_SLUG_STMT = select(BookingType).where(
+    BookingType.workspace_id == bindparam("workspace_id"),
+    BookingType.slug == bindparam("slug"),
+    BookingType.is_deleted.is_(False),
+)
+
+
+class _BookedIntervals:
+    """
+    Static overlap index over a day's bookings.
+
+    Bookings sorted by start with a running max of end: everything starting
+    before `end` is a prefix, and one of them overlaps [start, end) iff that
+    prefix's max end is after `start`. O(log n) per probe instead of a scan.
+    """
+
+    def __init__(self, intervals: list[tuple[datetime, datetime]]):
+        intervals.sort()
+        self._starts = [s for s, _ in intervals]
+        self._max_ends = list(accumulate((e for _, e in intervals), max))
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        i = bisect_left(self._starts, end)
+        return i > 0 and self._max_ends[i - 1] > start
+
+
 class PublicBookingService:
     def __init__(self, db: Session):
         self.db = db
@@ -52,8 +130,14 @@ class PublicBookingService:
     def list_booking_types(self, workspace_id: UUID) -> List[PublicBookingTypeOut]:
         workspace = self._get_active_workspace(workspace_id)
 
-        types = self.db.scalars(
-            select(BookingType)
+        rows = self.db.execute(
+            select(
+                BookingType.id,
+                BookingType.name,
+                BookingType.slug,
+                BookingType.description,
+                BookingType.duration_minutes,
+            )
             .where(
                 BookingType.workspace_id == workspace.id,
                 BookingType.is_deleted.is_(False),
@@ -61,7 +145,17 @@ class PublicBookingService:
             .order_by(BookingType.name)
         ).all()
 
-        return [PublicBookingTypeOut.model_validate(t) for t in types]
+        # Trusted DB values: skip per-row validation, stringify the id by hand
+        return [
+            PublicBookingTypeOut.model_construct(
+                id=str(r.id),
+                name=r.name,
+                slug=r.slug,
+                description=r.description,
+                duration_minutes=r.duration_minutes,
+            )
+            for r in rows
+        ]
 
     def get_availability_for_date(
         self,
@@ -91,6 +185,8 @@ class PublicBookingService:
                 AvailabilitySlot.end_at <= day_end,
             )
             .order_by(AvailabilitySlot.start_at)
+            # staff_name is read per slot; anything else lazy should fail loudly
+            .options(joinedload(AvailabilitySlot.staff_user), raiseload("*"))
         ).all()
         
         print(f"DEBUG: Found {len(slots)} availability slots for {day}")
@@ -116,29 +212,28 @@ class PublicBookingService:
                 Booking.start_at < max_end,
                 Booking.end_at > min_start,
             )
+            .options(raiseload("*"))
         ).all()
         
         print(f"DEBUG: Availability check for {day}, found {len(bookings)} bookings:")
         for i, b in enumerate(bookings):
             print(f"  {i+1}. {b.start_at} - {b.end_at} ({b.status})")
 
-        def slot_is_occupied(slot: AvailabilitySlot) -> bool:
-            for b in bookings:
-                same_staff = b.assigned_staff_id == slot.staff_user_id
-                # Compare database times directly (no UTC conversion needed)
-                
-                # if slot has no staff, treat any overlapping booking of this type as occupying
-                if slot.staff_user_id is None:
-                    if not (
-                        b.end_at <= slot.start_at or b.start_at >= slot.end_at
-                    ):
-                        return True
-                else:
-                    if same_staff and not (
-                        b.end_at <= slot.start_at or b.start_at >= slot.end_at
-                    ):
-                        return True
-            return False
+        # Unassigned slots are blocked by any booking of the type, staff slots
+        # only by that staff member's bookings.
+        booked_any = _BookedIntervals([(b.start_at, b.end_at) for b in bookings])
+        by_staff: dict[UUID, list[tuple[datetime, datetime]]] = {}
+        for b in bookings:
+            if b.assigned_staff_id is not None:
+                by_staff.setdefault(b.assigned_staff_id, []).append((b.start_at, b.end_at))
+        booked_by_staff = {k: _BookedIntervals(v) for k, v in by_staff.items()}
+        no_bookings = _BookedIntervals([])
+
+        def is_occupied(slot: AvailabilitySlot, start: datetime, end: datetime) -> bool:
+            # Compare database times directly (no UTC conversion needed)
+            if slot.staff_user_id is None:
+                return booked_any.overlaps(start, end)
+            return booked_by_staff.get(slot.staff_user_id, no_bookings).overlaps(start, end)
 
         result: List[PublicAvailabilitySlotOut] = []
         for s in slots:
@@ -151,16 +246,7 @@ class PublicBookingService:
                 hour_slot_end = current_start + timedelta(hours=1)
                 
                 # Check if this specific hour is occupied
-                hour_slot_occupied = False
-                for b in bookings:
-                    if (b.status != BookingStatus.cancelled):
-                        # Compare database times directly (no UTC conversion needed)
-                        
-                        if not (b.end_at <= current_start or b.start_at >= hour_slot_end):
-                            same_staff = b.assigned_staff_id == s.staff_user_id
-                            if s.staff_user_id is None or same_staff:
-                                hour_slot_occupied = True
-                                break
+                hour_slot_occupied = is_occupied(s, current_start, hour_slot_end)
                 
                 result.append(
                     PublicAvailabilitySlotOut(
@@ -176,16 +262,7 @@ class PublicBookingService:
             # Handle remaining partial hour if any
             if current_start < s.end_at:
                 # Check if this remaining slot is occupied
-                remaining_occupied = False
-                for b in bookings:
-                    if (b.status != BookingStatus.cancelled):
-                        # Compare database times directly (no UTC conversion needed)
-                        
-                        if not (b.end_at <= current_start or b.start_at >= s.end_at):
-                            same_staff = b.assigned_staff_id == s.staff_user_id
-                            if s.staff_user_id is None or same_staff:
-                                remaining_occupied = True
-                                break
+                remaining_occupied = is_occupied(s, current_start, s.end_at)
                 
                 result.append(
                     PublicAvailabilitySlotOut(
@@ -208,20 +285,26 @@ class PublicBookingService:
         Returns dates in [from_date, to_date] that have at least one available slot.
         Used by the booking page to show a month calendar.
         """
-        out: List[date] = []
-        d = from_date
-        while d <= to_date:
-            slots = self.get_availability_for_date(workspace_id, booking_type_slug, d)
-            if any(s.is_available for s in slots):
-                out.append(d)
-            d += timedelta(days=1)
-        return out
+        workspace = self._get_active_workspace(workspace_id)
+        bt = self._get_booking_type_by_slug(workspace.id, booking_type_slug)
+
+        return list(
+            self.db.scalars(
+                _AVAILABLE_DATES_SQL,
+                {
+                    "workspace_id": str(workspace.id),
+                    "booking_type_id": str(bt.id),
+                    "from_date": from_date,
+                    "to_date": to_date,
+                    "cancelled_status": enum_ordinal(BookingStatus.cancelled),
+                },
+            )
+        )
 
     def create_public_booking(
         self,
         workspace_id: UUID,
         data: PublicBookingCreateRequest,
-        background_tasks: Optional[BackgroundTasks] = None,
     ) -> PublicBookingResponse:
         workspace = self._get_active_workspace(workspace_id)
         bt = self._get_booking_type_by_slug(workspace.id, data.booking_type_slug)
@@ -256,44 +339,27 @@ class PublicBookingService:
                 detail="Booking duration cannot exceed 2 hours.",
             )
 
-        # Check if the requested time conflicts with existing bookings
-        print(f"DEBUG: Checking for conflicts between {start_at} and {end_at}")
-        
-        # First, let's see all bookings for this workspace and type
-        all_bookings = self.db.scalars(
-            select(Booking)
-            .where(
-                Booking.workspace_id == workspace.id,
-                Booking.booking_type_id == bt.id,
-                Booking.status != BookingStatus.cancelled,
+        self.db.execute(_BOOKING_LOCK_SQL, {"lock_key": f"booking:{workspace.id}:{bt.id}"})
+
+        # Check if the requested time conflicts with existing bookings. Stored
+        # ranges are closed '[]', so overlap with the open '()' request range
+        # means b.start_at < end_at AND b.end_at > start_at (touching is fine);
+        # served by ix_bookings_ws_type_range_gist.
+        conflict = self.db.scalar(
+            select(
+                exists().where(
+                    Booking.workspace_id == workspace.id,
+                    Booking.booking_type_id == bt.id,
+                    Booking.status != BookingStatus.cancelled,
+                    Booking.time_range.overlaps(func.tstzrange(start_at, end_at, "()")),
+                )
             )
-            .order_by(Booking.start_at)
-        ).all()
-        
-        print(f"DEBUG: Found {len(all_bookings)} total bookings:")
-        for i, b in enumerate(all_bookings):
-            # Compare database times directly (no UTC conversion needed)
-            print(f"  {i+1}. {b.start_at} - {b.end_at} ({b.status})")
-            # Check overlap using database times
-            overlap = (b.start_at < end_at and b.end_at > start_at)
-            print(f"     Overlap with request: {overlap}")
-        
-        # Find conflicting booking using database time comparison
-        conflicting_booking = None
-        for b in all_bookings:
-            overlap = (b.start_at < end_at and b.end_at > start_at)
-            if overlap:
-                conflicting_booking = b
-                break
-        
-        if conflicting_booking:
-            print(f"DEBUG: Found conflicting booking: {conflicting_booking.start_at} - {conflicting_booking.end_at} ({conflicting_booking.status})")
+        )
+        if conflict:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Time slot already booked.",
             )
-        else:
-            print("DEBUG: No conflicting booking found")
 
         contact = self._get_or_create_contact(workspace.id, data)
         conversation = self._get_or_create_conversation(workspace.id, contact)
@@ -325,8 +391,6 @@ class PublicBookingService:
         #         booking=booking,
         #     )
         #     message_channel = msg.channel
-        #     if background_tasks:
-        #         self._enqueue_confirmation_email(background_tasks, workspace, contact, booking)
 
         # Link active forms for this workspace
         forms = self._get_active_forms_for_workspace(workspace.id)
@@ -368,6 +432,7 @@ class PublicBookingService:
                     detail="Time slot already booked.",
                 )
             raise
+        invalidate_public_cache(workspace_id)
 
         self.db.refresh(booking)
 
@@ -379,12 +444,7 @@ class PublicBookingService:
     # ---------- Internals ----------
 
     def _get_active_workspace(self, workspace_id: UUID) -> Workspace:
-        ws = self.db.scalar(
-            select(Workspace).where(
-                Workspace.id == workspace_id,
-                Workspace.status == WorkspaceStatus.active,
-            )
-        )
+        ws = self.db.scalar(_ACTIVE_WORKSPACE_STMT, {"workspace_id": workspace_id})
         if not ws:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -396,11 +456,7 @@ class PublicBookingService:
         self, workspace_id: UUID, slug: str
     ) -> BookingType:
         bt = self.db.scalar(
-            select(BookingType).where(
-                BookingType.workspace_id == workspace_id,
-                BookingType.slug == slug,
-                BookingType.is_deleted.is_(False),
-            )
+            _BOOKING_TYPE_BY_SLUG_STMT, {"workspace_id": workspace_id, "slug": slug}
         )
         if not bt:
             raise HTTPException(
@@ -454,29 +510,9 @@ class PublicBookingService:
     def _get_or_create_conversation(
         self, workspace_id: UUID, contact: Contact
     ) -> Conversation:
-        conv = self.db.scalar(
-            select(Conversation).where(
-                Conversation.workspace_id == workspace_id,
-                Conversation.contact_id == contact.id,
-                Conversation.is_deleted.is_(False),
-            )
-        )
-        if conv:
+        conv, created = get_or_open_conversation(self.db, workspace_id, contact)
+        if not created:
             return conv
-
-        preferred = ChannelPreference.mixed
-        if contact.primary_email and not contact.primary_phone:
-            preferred = ChannelPreference.email
-        elif contact.primary_phone and not contact.primary_email:
-            preferred = ChannelPreference.sms
-
-        conv = Conversation(
-            workspace_id=workspace_id,
-            contact_id=contact.id,
-            status=ConversationStatus.open,
-            channel_preference=preferred,
-        )
-        self.db.add(conv)
         self._log_event(
             workspace_id=workspace_id,
             event_type="conversation.opened",
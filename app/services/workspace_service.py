@@ -1,12 +1,14 @@
 # app/services/workspace_service.py
 from __future__ import annotations
 
-from typing import List, Tuple
+import uuid
+from typing import Dict, List, Tuple
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import select, exists, func
+from sqlalchemy import select, exists, insert
 
+from app.core.ids import uuid7
 from app.core.security import hash_password  # you should implement this
 from app.models.workspace import Workspace, WorkspaceStatus
 from app.models.users import StaffUser, StaffRole
@@ -55,8 +57,11 @@ class WorkspaceOnboardingService:
 
         owner = self._create_owner_user(workspace, payload)
         self._connect_email_provider(workspace, payload)
-        self._create_booking_types(workspace, payload)
-        self._define_availability(workspace, payload)
+        # The session doesn't autoflush: write the owner and email config
+        # before the bulk inserts (slot FK to the owner) and exists() checks.
+        self.db.flush()
+        bt_ids_by_slug = self._create_booking_types(workspace, payload)
+        self._define_availability(workspace, payload, bt_ids_by_slug, owner)
 
         # Validation & activation decision
         validation = self._evaluate_activation_requirements(workspace)
@@ -72,15 +77,14 @@ class WorkspaceOnboardingService:
         else:
             workspace.status = WorkspaceStatus.pending_validation
 
-        self.db.commit()
-        self.db.refresh(workspace)
-        self.db.refresh(owner)
-
-        return WorkspaceOnboardingResponse(
+        # Build the response before commit so nothing needs a refresh.
+        response = WorkspaceOnboardingResponse(
             workspace=WorkspaceSummary.model_validate(workspace),
             owner_id=str(owner.id),
             validation=validation,
         )
+        self.db.commit()
+        return response
 
     # -------- Internal helpers --------
 
@@ -91,10 +95,10 @@ class WorkspaceOnboardingService:
 
         # Prevent duplicate owner email within this workspace
         existing = self.db.scalar(
-            select(StaffUser).where(
+            select(exists().where(
                 StaffUser.workspace_id == workspace.id,
                 StaffUser.email == owner_data.email,
-            )
+            ))
         )
         if existing:
             raise HTTPException(
@@ -103,6 +107,7 @@ class WorkspaceOnboardingService:
             )
 
         owner = StaffUser(
+            id=uuid7(),  # known up front; no flush needed for owner_id
             workspace_id=workspace.id,
             email=owner_data.email,
             full_name=owner_data.full_name,
@@ -111,7 +116,6 @@ class WorkspaceOnboardingService:
             is_active=True,
         )
         self.db.add(owner)
-        self.db.flush()
 
         workspace.owner_id = owner.id
 
@@ -138,7 +142,6 @@ class WorkspaceOnboardingService:
             is_active=True,
         )
         self.db.add(email_cfg)
-        self.db.flush()
 
         self._log_event(
             workspace,
@@ -153,71 +156,56 @@ class WorkspaceOnboardingService:
 
     def _create_booking_types(
         self, workspace: Workspace, payload: WorkspaceOnboardingRequest
-    ) -> List[BookingType]:
-        created: List[BookingType] = []
+    ) -> Dict[str, uuid.UUID]:
+        # The workspace was created in this transaction, so slugs can only
+        # collide within the payload itself.
+        seen: set[str] = set()
+        bt_rows: List[dict] = []
         for bt in payload.booking_types:
-            # Enforce unique slug per workspace
-            exists_slug = self.db.scalar(
-                select(exists().where(
-                    BookingType.workspace_id == workspace.id,
-                    BookingType.slug == bt.slug,
-                    BookingType.is_deleted.is_(False),
-                ))
-            )
-            if exists_slug:
+            if bt.slug in seen:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Booking type slug '{bt.slug}' already exists.",
                 )
-
-            bt_row = BookingType(
-                workspace_id=workspace.id,
-                name=bt.name,
-                slug=bt.slug,
-                description=bt.description,
-                duration_minutes=bt.duration_minutes,
+            seen.add(bt.slug)
+            bt_rows.append(
+                {
+                    "id": uuid7(),
+                    "workspace_id": workspace.id,
+                    "name": bt.name,
+                    "slug": bt.slug,
+                    "description": bt.description,
+                    "duration_minutes": bt.duration_minutes,
+                }
             )
-            self.db.add(bt_row)
-            created.append(bt_row)
 
-        self.db.flush()
+        # One multi-row INSERT; ids are minted here, so no RETURNING is needed.
+        if bt_rows:  # an empty executemany would emit INSERT ... DEFAULT VALUES
+            self.db.execute(insert(BookingType), bt_rows)
 
         self._log_event(
             workspace,
             event_type="workspace.booking_types_created",
             actor_type=ActorType.system,
-            payload={"count": len(created)},
+            payload={"count": len(bt_rows)},
         )
-        return created
+        return {row["slug"]: row["id"] for row in bt_rows}
 
     def _define_availability(
-        self, workspace: Workspace, payload: WorkspaceOnboardingRequest
-    ) -> List[AvailabilitySlot]:
-        # Map slug -> BookingType.id for this workspace to enforce isolation
-        booking_types = self.db.scalars(
-            select(BookingType).where(
-                BookingType.workspace_id == workspace.id,
-                BookingType.is_deleted.is_(False),
-            )
-        ).all()
-        bt_by_slug = {bt.slug: bt for bt in booking_types}
-
-        # Map staff email -> StaffUser.id in this workspace
-        staff_by_email = {
-            u.email: u
-            for u in self.db.scalars(
-                select(StaffUser).where(
-                    StaffUser.workspace_id == workspace.id,
-                    StaffUser.is_deleted.is_(False),
-                )
-            ).all()
-        }
+        self,
+        workspace: Workspace,
+        payload: WorkspaceOnboardingRequest,
+        bt_ids_by_slug: Dict[str, uuid.UUID],
+        owner: StaffUser,
+    ) -> int:
+        # A freshly onboarded workspace has exactly one staff member: the owner.
+        staff_ids_by_email = {owner.email: owner.id}
 
-        slots: List[AvailabilitySlot] = []
+        slot_rows: List[dict] = []
 
         for slot in payload.availability:
-            bt = bt_by_slug.get(slot.booking_type_slug)
-            if not bt:
+            bt_id = bt_ids_by_slug.get(slot.booking_type_slug)
+            if not bt_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Unknown booking_type_slug '{slot.booking_type_slug}' for this workspace.",
@@ -225,13 +213,12 @@ class WorkspaceOnboardingService:
 
             staff_user_id = None
             if slot.staff_email:
-                staff = staff_by_email.get(slot.staff_email)
-                if not staff:
+                staff_user_id = staff_ids_by_email.get(slot.staff_email)
+                if not staff_user_id:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Unknown staff_email '{slot.staff_email}' for this workspace.",
                     )
-                staff_user_id = staff.id
 
             if slot.end_at <= slot.start_at:
                 raise HTTPException(
@@ -239,25 +226,26 @@ class WorkspaceOnboardingService:
                     detail="Availability slot end_at must be after start_at.",
                 )
 
-            av = AvailabilitySlot(
-                workspace_id=workspace.id,
-                booking_type_id=bt.id,
-                staff_user_id=staff_user_id,
-                start_at=slot.start_at,
-                end_at=slot.end_at,
+            slot_rows.append(
+                {
+                    "workspace_id": workspace.id,
+                    "booking_type_id": bt_id,
+                    "staff_user_id": staff_user_id,
+                    "start_at": slot.start_at,
+                    "end_at": slot.end_at,
+                }
             )
-            self.db.add(av)
-            slots.append(av)
 
-        self.db.flush()
+        if slot_rows:  # an empty executemany would emit INSERT ... DEFAULT VALUES
+            self.db.execute(insert(AvailabilitySlot), slot_rows)
 
         self._log_event(
             workspace,
             event_type="workspace.availability_defined",
             actor_type=ActorType.system,
-            payload={"count": len(slots)},
+            payload={"count": len(slot_rows)},
         )
-        return slots
+        return len(slot_rows)
 
     # -------- Activation / validation --------
 
@@ -266,32 +254,23 @@ class WorkspaceOnboardingService:
     ) -> OnboardingValidationStatus:
         ws_id = workspace.id
 
-        # Communication channel: active email config
-        email_connected = bool(
-            self.db.scalar(
-                select(func.count()).select_from(WorkspaceEmailConfig).where(
+        # All three checks in one round trip; EXISTS stops at the first row.
+        email_connected, has_booking_types, has_availability = self.db.execute(
+            select(
+                # Communication channel: active email config
+                exists().where(
                     WorkspaceEmailConfig.workspace_id == ws_id,
                     WorkspaceEmailConfig.is_active.is_(True),
-                )
-            )
-        )
-
-        has_booking_types = bool(
-            self.db.scalar(
-                select(func.count()).select_from(BookingType).where(
+                ),
+                exists().where(
                     BookingType.workspace_id == ws_id,
                     BookingType.is_deleted.is_(False),
-                )
-            )
-        )
-
-        has_availability = bool(
-            self.db.scalar(
-                select(func.count()).select_from(AvailabilitySlot).where(
+                ),
+                exists().where(
                     AvailabilitySlot.workspace_id == ws_id,
-                )
+                ),
             )
-        )
+        ).one()
 
         reasons: List[str] = []
         if not email_connected: